@@ -0,0 +1,238 @@
+import argparse
+import asyncio
+import contextlib
+import os
+import time
+
+from neo4j import AsyncGraphDatabase
+
+from funcs_neo4j import (
+    CONSTRAINTS, LOAD_STEPS, RAW_BASE, RECORD_LOAD_VERSION_QUERY, SYNC_PHASES, GraphDBManager,
+    is_schema_query, load_connection_settings, print_sync_summary, step_queries, sync_phases,
+)
+from graph_schema import SHOW_INDEXES_QUERY, create_index_query, missing_indexes
+from load_metrics import REPORT_DIR, LoadReport
+from graph_snapshot import (
+    LOAD_VERSION_PATH, PROCESSED_DIR, STATE_PATH,
+    build_snapshot, bump_load_version, diff_snapshot, load_state, save_state, snapshot_state,
+)
+
+async def batched(rows, batch_size):
+    # Accepts plain and async iterables so a live producer can stream rows in
+    batch = []
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    else:
+        for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+def _loader_step(step):
+    async def run(self):
+        await self.run_step(step)
+    run.__name__ = step
+    return run
+
+class AsyncGraphDBManager:
+    """
+    asyncio counterpart of GraphDBManager. Loader steps run the same Cypher as the
+    synchronous class; pool size and acquisition timeout fall back to the
+    NEO4J_MAX_CONNECTION_POOL_SIZE / NEO4J_CONNECTION_ACQUISITION_TIMEOUT env vars,
+    then to the driver defaults.
+    """
+
+    def __init__(self, max_connection_pool_size=None, connection_acquisition_timeout=None, profile=False):
+        settings = load_connection_settings()
+
+        pool_config = {}
+        max_connection_pool_size = max_connection_pool_size or os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE")
+        if max_connection_pool_size:
+            pool_config["max_connection_pool_size"] = int(max_connection_pool_size)
+        connection_acquisition_timeout = connection_acquisition_timeout or os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT")
+        if connection_acquisition_timeout:
+            pool_config["connection_acquisition_timeout"] = float(connection_acquisition_timeout)
+
+        self.DATABASE = settings["database"]
+        self.driver = AsyncGraphDatabase.driver(settings["uri"], auth=settings["auth"], **pool_config)
+        self.report = None
+        self.profile = profile
+
+    async def connect(self):
+        await self.driver.verify_connectivity()
+        print("Connected to Neo4j database successfully.")
+
+    async def close(self):
+        await self.driver.close()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def execute_query(self, query, **params):
+        if self.profile and not is_schema_query(query):
+            query = f"PROFILE {query}"
+        start = time.perf_counter()
+        result = await self.driver.execute_query(query, database_=self.DATABASE, **params)
+        if self.report is not None:
+            self.report.record_query(result.summary, time.perf_counter() - start)
+        return result
+
+    def _step(self, name):
+        return self.report.step(name) if self.report is not None else contextlib.nullcontext()
+
+    async def write_batches(self, query, rows, batch_size=1000, concurrency=4):
+        """
+        Run `query` with $rows bound to successive batches, at most `concurrency`
+        transactions in flight. Pulling the next batch waits for a free slot, so a
+        fast producer is held back instead of buffering unbounded rows.
+        Returns the number of rows written.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        pending = set()
+        errors = []
+        written = 0
+
+        def finished(task):
+            pending.discard(task)
+            semaphore.release()
+            if not task.cancelled() and task.exception() is not None:
+                errors.append(task.exception())
+
+        async for batch in batched(rows, batch_size):
+            await semaphore.acquire()
+            if errors:
+                semaphore.release()
+                break
+            task = asyncio.create_task(self.execute_query(query, rows=batch))
+            pending.add(task)
+            task.add_done_callback(finished)
+            written += len(batch)
+
+        if pending:
+            await asyncio.wait(set(pending))
+        if errors:
+            raise errors[0]
+        return written
+
+    async def run_step(self, step):
+        for query, params in step_queries(step):
+            await self.execute_query(query, **params)
+        print(f"{step} completed successfully.")
+
+    add_conferences = _loader_step("add_conferences")
+    add_highschools = _loader_step("add_highschools")
+    add_teams = _loader_step("add_teams")
+    add_players = _loader_step("add_players")
+    add_positions = _loader_step("add_positions")
+    add_coaches = _loader_step("add_coaches")
+    add_colleges = _loader_step("add_colleges")
+    add_player_relationships = _loader_step("add_player_relationships")
+    add_team_relationships = _loader_step("add_team_relationships")
+    add_coach_relationships = _loader_step("add_coach_relationships")
+    add_coach_careers = _loader_step("add_coach_careers")
+    add_transfer_relationships = _loader_step("add_transfer_relationships")
+    add_high_school_stats = _loader_step("add_high_school_stats")
+    add_conference_stats = _loader_step("add_conference_stats")
+    add_shared_high_school_stats = _loader_step("add_shared_high_school_stats")
+    add_transfer_stats = _loader_step("add_transfer_stats")
+
+    async def create_constraints(self):
+        for q in CONSTRAINTS:
+            await self.execute_query(q)
+        print("Constraints created successfully.")
+
+    async def create_indexes(self):
+        records, _, _ = await self.execute_query(SHOW_INDEXES_QUERY)
+        for index in missing_indexes(GraphDBManager, records):
+            await self.execute_query(create_index_query(index))
+        print("Indexes created successfully.")
+
+    async def delete_all(self):
+        await self.execute_query("MATCH (n) DETACH DELETE n;")
+        print("All nodes and relationships deleted successfully.")
+
+    async def sync_all(self, processed_dir=PROCESSED_DIR, state_path=STATE_PATH, batch_size=1000, concurrency=4,
+                       version_path=LOAD_VERSION_PATH, report_dir=REPORT_DIR):
+        # Same paths as GraphDBManager.sync_all; scratch databases pass their own
+        self.report = LoadReport("sync", profile=self.profile)
+        try:
+            with self._step("build_snapshot"):
+                # Snapshot building is pandas work; keep it off the event loop
+                snapshot = await asyncio.to_thread(build_snapshot, processed_dir)
+                changes = diff_snapshot(load_state(state_path), snapshot)
+
+            with self._step("create_constraints"):
+                await self.create_constraints()
+            with self._step("create_indexes"):
+                await self.create_indexes()
+
+            for name, phase in zip(SYNC_PHASES, sync_phases(changes)):
+                with self._step(name):
+                    for query, rows in phase:
+                        await self.write_batches(query, rows, batch_size, concurrency)
+
+            save_state(snapshot_state(snapshot), state_path)
+            await self.record_load_version(version_path)
+            print_sync_summary(changes)
+            self.report.finish()
+            self.report.print_summary()
+        finally:
+            self.report.write(report_dir)
+            self.report = None
+
+    async def record_load_version(self, version_path=LOAD_VERSION_PATH):
+        with self._step("record_load_version"):
+            await self.execute_query(RECORD_LOAD_VERSION_QUERY)
+        bump_load_version(version_path)
+
+    async def load_all(self, state_path=STATE_PATH):
+        # Unlike GraphDBManager.load_all, the driver stays open for the caller
+        self.report = LoadReport("load", profile=self.profile)
+        try:
+            with self._step("build_snapshot"):
+                # Same files LOAD CSV reads, so the next sync diffs against what was actually loaded
+                snapshot = await asyncio.to_thread(build_snapshot, RAW_BASE)
+            with self._step("delete_all"):
+                await self.delete_all()
+            with self._step("create_constraints"):
+                await self.create_constraints()
+            with self._step("create_indexes"):
+                await self.create_indexes()
+            for step in LOAD_STEPS:
+                with self._step(step):
+                    await getattr(self, step)()
+            save_state(snapshot_state(snapshot), state_path)
+            await self.record_load_version()
+            self.report.finish()
+            self.report.print_summary()
+        finally:
+            self.report.write()
+            self.report = None
+
+async def main(args):
+    async with AsyncGraphDBManager(args.max_pool_size, args.acquisition_timeout, args.profile) as manager:
+        if args.command == "sync":
+            await manager.sync_all(batch_size=args.batch_size, concurrency=args.concurrency)
+        else:
+            await manager.load_all()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load or sync the graph with the async Neo4j driver.")
+    parser.add_argument("command", choices=["load", "sync"])
+    parser.add_argument("--max-pool-size", type=int)
+    parser.add_argument("--acquisition-timeout", type=float)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--profile", action="store_true", help="run loader queries under PROFILE")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,143 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from graph_engine import CSRGraph
+from graph_snapshot import build_snapshot
+from process_data import run_pipeline
+from synthetic_league import generate_league, write_league
+
+DEFAULT_SIZES = ['20x2', '80x4', '320x8']
+REPORT_DIR = 'reports'
+
+class StageTimer:
+    """Collects wall time and (optionally) tracemalloc peak memory per named stage."""
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def __call__(self, name):
+        if self.memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if self.memory else None
+            self.stages[name] = {'seconds': elapsed, 'peak_mb': peak / 2**20 if peak is not None else None}
+
+def parse_size(size):
+    teams, seasons = size.lower().split('x')
+    return int(teams), int(seasons)
+
+def run_size(teams, seasons, players_per_team, memory, load_database=None):
+    timer = StageTimer(memory)
+    with tempfile.TemporaryDirectory() as tmp:
+        with timer('generate'):
+            players, coaches, high_schools, colleges = generate_league(teams, seasons, players_per_team)
+            raw_dir, processed_dir = write_league(tmp, players, coaches, high_schools, colleges)
+
+        # process_data prints dedup statistics; keep the benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_pipeline(raw_dir, processed_dir, dict(colleges), stage=timer)
+
+        with timer('build_snapshot'):
+            snapshot = build_snapshot(processed_dir)
+        with timer('build_csr_graph'):
+            graph = CSRGraph(snapshot)
+        with timer('csr_transfer_counts'):
+            graph.transfer_counts()
+        with timer('csr_teams_sharing_high_schools'):
+            graph.teams_sharing_high_schools()
+
+        if load_database:
+            from funcs_neo4j import GraphDBManager
+
+            manager = GraphDBManager()
+            manager.DATABASE = load_database
+            try:
+                with timer('graph_delete_all'):
+                    manager.delete_all()
+                with timer('graph_sync_load'):
+                    # Keep state, load version and reports of the scratch load out of data/ and reports/
+                    manager.sync_all(
+                        processed_dir, os.path.join(tmp, 'graph_state.json'),
+                        version_path=os.path.join(tmp, 'load_version'), report_dir=os.path.join(tmp, 'reports'),
+                    )
+            finally:
+                manager.close()
+
+    return {
+        'teams': teams,
+        'seasons': seasons,
+        'player_rows': len(players),
+        'coach_rows': len(coaches),
+        'stages': timer.stages,
+    }
+
+def scaling_exponent(results, stage):
+    # Slope of log(time) vs log(player rows) between the smallest and largest size
+    first, last = results[0], results[-1]
+    t1, t2 = first['stages'][stage]['seconds'], last['stages'][stage]['seconds']
+    n1, n2 = first['player_rows'], last['player_rows']
+    if t1 <= 0 or t2 <= 0 or n1 == n2:
+        return None
+    return math.log(t2 / t1) / math.log(n2 / n1)
+
+def print_curves(results, memory):
+    stages = list(results[0]['stages'])
+    header = f"{'stage':<32}" + ''.join(f"{r['player_rows']:>12,}" for r in results) + f"{'exponent':>10}"
+    print('\nTime (s) by player rows')
+    print(header)
+    for stage in stages:
+        exponent = scaling_exponent(results, stage) if len(results) > 1 else None
+        print(
+            f'{stage:<32}'
+            + ''.join(f"{r['stages'][stage]['seconds']:>12.3f}" for r in results)
+            + (f'{exponent:>10.2f}' if exponent is not None else f"{'-':>10}")
+        )
+    if memory:
+        print('\nPeak traced memory (MB) by player rows')
+        print(f"{'stage':<32}" + ''.join(f"{r['player_rows']:>12,}" for r in results))
+        for stage in stages:
+            print(f'{stage:<32}' + ''.join(f"{r['stages'][stage]['peak_mb']:>12.1f}" for r in results))
+
+def run_benchmark(sizes=DEFAULT_SIZES, players_per_team=40, memory=True, load_database=None):
+    if memory:
+        tracemalloc.start()
+
+    results = []
+    for size in sizes:
+        teams, seasons = parse_size(size)
+        print(f'Running {teams} teams x {seasons} seasons...')
+        results.append(run_size(teams, seasons, players_per_team, memory, load_database))
+
+    if memory:
+        tracemalloc.stop()
+    print_curves(results, memory)
+
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    path = os.path.join(REPORT_DIR, f"benchmark-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json")
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({'memory': memory, 'results': results}, file, indent=2)
+    print(f'\nBenchmark results written to {path}.')
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scaling benchmark for process_data and the graph load on synthetic leagues.')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help='TEAMSxSEASONS, e.g. 20x2 80x4')
+    parser.add_argument('--players-per-team', type=int, default=40)
+    parser.add_argument('--no-memory', action='store_true', help='skip tracemalloc (its overhead inflates timings)')
+    parser.add_argument('--load-database', help='also sync each league into this (scratch!) Neo4j database')
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.players_per_team, not args.no_memory, args.load_database)
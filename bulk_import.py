@@ -0,0 +1,176 @@
+import argparse
+import csv
+import hashlib
+import os
+import shutil
+import subprocess
+import time
+
+from graph_snapshot import (
+    RELATIONSHIPS, PROCESSED_DIR, STATE_PATH,
+    build_snapshot, entry_key, save_state, snapshot_state,
+)
+
+IMPORT_DIR = 'data/import'
+ARRAY_DELIMITER = ';'
+
+
+def node_id(label, key):
+    # Stable across runs: derived only from the node's identifying properties
+    return hashlib.sha1(f'{label}:{entry_key(key)}'.encode('utf-8')).hexdigest()[:16]
+
+def typed_header(prop, values):
+    # neo4j-admin header type from the snapshot values (ints come from toInteger() in the loader)
+    values = [v for v in values if v is not None]
+    if values and all(isinstance(v, list) for v in values):
+        return f'{prop}:string[]'
+    if values and all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return f'{prop}:int'
+    return prop
+
+def format_value(val):
+    if val is None:
+        return ''
+    if isinstance(val, list):
+        return ARRAY_DELIMITER.join(val)
+    return val
+
+def property_names(entries, fields):
+    names = []
+    for entry in entries:
+        for field in fields:
+            for prop in entry[field]:
+                if prop not in names:
+                    names.append(prop)
+    return names
+
+def export_import_files(processed_dir=PROCESSED_DIR, out_dir=IMPORT_DIR):
+    """
+    Write one node file per label and one relationship file per type in the
+    neo4j-admin import format. Returns {'nodes': {label: path}, 'relationships': {type: path}}.
+    """
+    snapshot = build_snapshot(processed_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    files = {'nodes': {}, 'relationships': {}}
+
+    for label, entries in snapshot['nodes'].items():
+        entries = list(entries.values())
+        props = property_names(entries, ['key', 'props'])
+        path = os.path.join(out_dir, f'nodes_{label.lower()}.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            rows = [{**entry['key'], **entry['props']} for entry in entries]
+            writer.writerow([f':ID({label})'] + [typed_header(p, [r.get(p) for r in rows]) for p in props])
+            for entry, values in zip(entries, rows):
+                writer.writerow([node_id(label, entry['key'])] + [format_value(values.get(p)) for p in props])
+        files['nodes'][label] = path
+
+    for rel_type, entries in snapshot['relationships'].items():
+        start_label, end_label, _ = RELATIONSHIPS[rel_type]
+        entries = list(entries.values())
+        props = property_names(entries, ['merge', 'props'])
+        path = os.path.join(out_dir, f'relationships_{rel_type.lower()}.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            rows = [{**entry['merge'], **entry['props']} for entry in entries]
+            writer.writerow(
+                [f':START_ID({start_label})']
+                + [typed_header(p, [r.get(p) for r in rows]) for p in props]
+                + [f':END_ID({end_label})']
+            )
+            for entry, values in zip(entries, rows):
+                writer.writerow(
+                    [node_id(start_label, entry['start'])]
+                    + [format_value(values.get(p)) for p in props]
+                    + [node_id(end_label, entry['end'])]
+                )
+        files['relationships'][rel_type] = path
+
+    node_count = sum(len(v) for v in snapshot['nodes'].values())
+    rel_count = sum(len(v) for v in snapshot['relationships'].values())
+    print(f"Exported {node_count} nodes and {rel_count} relationships to {out_dir}.")
+    return files
+
+def import_command(files, database='neo4j', neo4j_admin='neo4j-admin'):
+    # Neo4j 5 syntax; the database must be stopped (or not exist yet)
+    cmd = [
+        neo4j_admin, 'database', 'import', 'full', database,
+        '--overwrite-destination=true',
+        f'--array-delimiter={ARRAY_DELIMITER}',
+    ]
+    cmd += [f'--nodes={label}={path}' for label, path in files['nodes'].items()]
+    cmd += [f'--relationships={rel_type}={path}' for rel_type, path in files['relationships'].items()]
+    return cmd
+
+def run_import(files, database='neo4j', neo4j_home=None):
+    neo4j_admin = 'neo4j-admin'
+    if neo4j_home:
+        neo4j_admin = os.path.join(neo4j_home, 'bin', 'neo4j-admin')
+    if shutil.which(neo4j_admin) is None:
+        raise RuntimeError(f"{neo4j_admin} not found; pass --neo4j-home or add it to PATH.")
+
+    start = time.perf_counter()
+    subprocess.run(import_command(files, database, neo4j_admin), check=True)
+    print(f"Database '{database}' imported in {time.perf_counter() - start:.1f}s.")
+    print("Start the database, then run `python bulk_import.py verify` to create constraints and check counts.")
+
+def verify_import(manager, processed_dir=PROCESSED_DIR, state_path=STATE_PATH):
+    """
+    Compare node and relationship counts in the running database with the
+    processed data, then add the constraints and indexes the offline import skips.
+    Only a matching graph is recorded as the sync state and a new load version.
+    """
+    snapshot = build_snapshot(processed_dir)
+    mismatches = []
+
+    for label, entries in snapshot['nodes'].items():
+        records, _, _ = manager.driver.execute_query(
+            f"MATCH (n:{label}) RETURN count(n) AS count", database_=manager.DATABASE
+        )
+        if records[0]['count'] != len(entries):
+            mismatches.append(f"{label}: expected {len(entries)}, found {records[0]['count']}")
+
+    for rel_type, entries in snapshot['relationships'].items():
+        records, _, _ = manager.driver.execute_query(
+            f"MATCH ()-[r:{rel_type}]->() RETURN count(r) AS count", database_=manager.DATABASE
+        )
+        if records[0]['count'] != len(entries):
+            mismatches.append(f"{rel_type}: expected {len(entries)}, found {records[0]['count']}")
+
+    manager.create_constraints()
+    manager.create_indexes()
+
+    for mismatch in mismatches:
+        print(f"MISMATCH: {mismatch}")
+    if mismatches:
+        # Recording this snapshot would make the next sync skip whatever is missing
+        print("Sync state and load version left unchanged; re-import before syncing.")
+        return mismatches
+
+    # The import replaced the whole graph, so the next sync must diff against this data
+    save_state(snapshot_state(snapshot), state_path)
+    manager.record_load_version()
+    print("Imported graph matches processed data.")
+    return mismatches
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Offline bulk import of data/processed/ with neo4j-admin.')
+    parser.add_argument('command', choices=['export', 'import', 'verify'])
+    parser.add_argument('--processed-dir', default=PROCESSED_DIR)
+    parser.add_argument('--out-dir', default=IMPORT_DIR)
+    parser.add_argument('--database', default='neo4j')
+    parser.add_argument('--neo4j-home', default=os.getenv('NEO4J_HOME'))
+    args = parser.parse_args()
+
+    if args.command == 'verify':
+        from funcs_neo4j import GraphDBManager
+
+        manager = GraphDBManager()
+        try:
+            verify_import(manager, args.processed_dir)
+        finally:
+            manager.close()
+    else:
+        files = export_import_files(args.processed_dir, args.out_dir)
+        if args.command == 'import':
+            run_import(files, args.database, args.neo4j_home)
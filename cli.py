@@ -0,0 +1,169 @@
+"""
+Single entry point for the pipeline: python cli.py {scrape,process,load,sync,bench,status,startup}.
+
+Only the standard library is imported at module level. pandas, rapidfuzz, bs4 and
+the neo4j driver are imported inside the commands that need them, so `--help`
+and `status` start instantly.
+"""
+import argparse
+import csv
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROCESSED_DIR = 'data/processed'
+RAW_DIR = 'data/raw'
+REPORT_DIR = 'reports'
+
+# Modules each command imports; `startup` times importing exactly these
+COMMAND_MODULES = {
+    'scrape': ['scraper'],
+    'process': ['process_data'],
+    'load': ['funcs_neo4j'],
+    'sync': ['funcs_neo4j'],
+    'bench': ['benchmark'],
+    'status': ['graph_snapshot'],
+}
+
+def load_modules(command):
+    return [importlib.import_module(name) for name in COMMAND_MODULES[command]]
+
+def cmd_scrape(args):
+    scraper, = load_modules('scrape')
+    scraper.scrape_all()
+
+def cmd_process(args):
+    process_data, = load_modules('process')
+    process_data.run_pipeline(args.raw_dir, args.processed_dir)
+
+def cmd_load(args):
+    funcs_neo4j, = load_modules('load')
+    funcs_neo4j.GraphDBManager(profile=args.profile).load_all()
+
+def cmd_sync(args):
+    funcs_neo4j, = load_modules('sync')
+    manager = funcs_neo4j.GraphDBManager(profile=args.profile)
+    try:
+        manager.sync_all(args.processed_dir, batch_size=args.batch_size)
+    finally:
+        manager.close()
+
+def cmd_bench(args):
+    benchmark, = load_modules('bench')
+    benchmark.run_benchmark(args.sizes, args.players_per_team, not args.no_memory, args.load_database)
+
+def count_rows(path):
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        return max(sum(1 for _ in csv.reader(file)) - 1, 0)
+
+def format_mtime(path):
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(os.path.getmtime(path)))
+
+def cmd_status(args):
+    graph_snapshot, = load_modules('status')
+
+    print(f'Processed data ({args.processed_dir}):')
+    if os.path.isdir(args.processed_dir):
+        for name in sorted(os.listdir(args.processed_dir)):
+            path = os.path.join(args.processed_dir, name)
+            if name.endswith('.csv'):
+                print(f'  {name:<32} {count_rows(path):>8} rows   {format_mtime(path)}')
+    else:
+        print('  missing')
+
+    print(f'Graph load version: {graph_snapshot.read_load_version()}')
+
+    state_path = graph_snapshot.STATE_PATH
+    if os.path.exists(state_path):
+        state = graph_snapshot.load_state(state_path)
+        nodes = sum(len(v) for v in state['nodes'].values())
+        rels = sum(len(v) for v in state['relationships'].values())
+        print(f'Last sync snapshot: {nodes} nodes, {rels} relationships ({format_mtime(state_path)})')
+    else:
+        print('Last sync snapshot: none')
+
+    reports = sorted(
+        (f for f in os.listdir(REPORT_DIR) if f.endswith('.json')),
+        key=lambda f: os.path.getmtime(os.path.join(REPORT_DIR, f)),
+    ) if os.path.isdir(REPORT_DIR) else []
+    if reports:
+        with open(os.path.join(REPORT_DIR, reports[-1]), encoding='utf-8') as file:
+            report = json.load(file)
+        total = report.get('total_time_s')
+        print(f"Latest report: {reports[-1]}" + (f" ({total:.1f}s)" if total else ''))
+    else:
+        print('Latest report: none')
+
+def cmd_startup(args):
+    # Fresh interpreter per command so nothing is already cached in sys.modules
+    baseline = cold_start_seconds([])
+    print(f"{'command':<10} {'cold start':>12} {'over bare python':>18}")
+    print(f"{'(python)':<10} {baseline:>11.3f}s {'':>18}")
+    for command, modules in COMMAND_MODULES.items():
+        seconds = cold_start_seconds(modules)
+        if seconds is None:
+            print(f"{command:<10} {'import failed (missing dependency?)':>31}")
+        else:
+            print(f'{command:<10} {seconds:>11.3f}s {seconds - baseline:>17.3f}s')
+
+def cold_start_seconds(modules, repeat=3):
+    code = 'import cli' + ''.join(f'; import {m}' for m in modules)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if result.returncode != 0:
+            return None
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='cli.py', description='NCAA baseball knowledge graph pipeline.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('scrape', help='scrape rosters into data/raw/')
+    p.set_defaults(func=cmd_scrape)
+
+    p = sub.add_parser('process', help='clean data/raw/ into data/processed/')
+    p.add_argument('--raw-dir', default=RAW_DIR)
+    p.add_argument('--processed-dir', default=PROCESSED_DIR)
+    p.set_defaults(func=cmd_process)
+
+    p = sub.add_parser('load', help='wipe and rebuild the Neo4j graph')
+    p.add_argument('--profile', action='store_true', help='run loader queries under PROFILE')
+    p.set_defaults(func=cmd_load)
+
+    p = sub.add_parser('sync', help='apply only changes since the last sync to Neo4j')
+    p.add_argument('--processed-dir', default=PROCESSED_DIR)
+    p.add_argument('--batch-size', type=int, default=1000)
+    p.add_argument('--profile', action='store_true', help='run loader queries under PROFILE')
+    p.set_defaults(func=cmd_sync)
+
+    p = sub.add_parser('bench', help='scaling benchmark on synthetic leagues')
+    p.add_argument('--sizes', nargs='+', default=['20x2', '80x4', '320x8'], help='TEAMSxSEASONS, e.g. 20x2 80x4')
+    p.add_argument('--players-per-team', type=int, default=40)
+    p.add_argument('--no-memory', action='store_true', help='skip tracemalloc (its overhead inflates timings)')
+    p.add_argument('--load-database', help='also sync each league into this (scratch!) Neo4j database')
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser('status', help='processed data, load version and last sync/report (no database access)')
+    p.add_argument('--processed-dir', default=PROCESSED_DIR)
+    p.set_defaults(func=cmd_status)
+
+    p = sub.add_parser('startup', help='measure cold-start import time of every command')
+    p.set_defaults(func=cmd_startup)
+
+    return parser
+
+if __name__ == '__main__':
+    args = build_parser().parse_args()
+    args.func(args)
@@ -1,62 +1,258 @@
 from neo4j import GraphDatabase
 import dotenv
+import contextlib
+import io
 import os
+import sys
+import time
+
+from load_metrics import REPORT_DIR, LoadReport
+from graph_schema import SchemaManager, node_index, relationship_index, uses_indexes
+from graph_snapshot import (
+    NODE_KEYS, RELATIONSHIPS, LOAD_VERSION_PATH, PROCESSED_DIR, STATE_PATH,
+    build_snapshot, bump_load_version, diff_snapshot, load_state, save_state, snapshot_state,
+)
 
 RAW_BASE = "https://raw.githubusercontent.com/danielee982/diamond-knowledge-graph/main/data/processed"
+ENV_FILE = "Neo4j-b9043243-Created-2025-11-16.txt"
+
+# Order matters: relationship steps MATCH nodes created by the earlier steps
+LOAD_STEPS = [
+    "add_conferences",
+    "add_highschools",
+    "add_teams",
+    "add_players",
+    "add_positions",
+    "add_coaches",
+    "add_colleges",
+    "add_player_relationships",
+    "add_team_relationships",
+    "add_coach_relationships",
+    "add_coach_careers",
+    "add_transfer_relationships",
+    "add_high_school_stats",
+    "add_conference_stats",
+    "add_shared_high_school_stats",
+    "add_transfer_stats",
+]
+
+CONSTRAINTS = [
+    # Players were keyed on (name, hometown) before process_data assigned Player IDs
+    "DROP CONSTRAINT player_identity_unique IF EXISTS;",
+    """CREATE CONSTRAINT player_id_unique IF NOT EXISTS
+        FOR (p:Player) REQUIRE p.playerId IS UNIQUE;""",
+    """CREATE CONSTRAINT coach_identity_unique IF NOT EXISTS
+        FOR (c:Coach) REQUIRE c.name IS UNIQUE;""",
+    """CREATE CONSTRAINT team_name_unique IF NOT EXISTS
+        FOR (t:Team) REQUIRE t.name IS UNIQUE;""",
+    """CREATE CONSTRAINT college_name_unique IF NOT EXISTS
+        FOR (c:College) REQUIRE c.name IS UNIQUE;""",
+    """CREATE CONSTRAINT high_school_name_unique IF NOT EXISTS
+        FOR (hs:HighSchool) REQUIRE hs.name IS UNIQUE;""",
+    """CREATE CONSTRAINT conference_name_unique IF NOT EXISTS
+        FOR (c:Conference) REQUIRE c.name IS UNIQUE;""",
+    """CREATE CONSTRAINT position_name_unique IF NOT EXISTS
+        FOR (p:Position) REQUIRE p.name IS UNIQUE;""",
+    """CREATE CONSTRAINT high_school_season_stats_unique IF NOT EXISTS
+        FOR (s:HighSchoolSeasonStats) REQUIRE (s.season, s.highSchool) IS UNIQUE;""",
+    """CREATE CONSTRAINT conference_season_stats_unique IF NOT EXISTS
+        FOR (s:ConferenceSeasonStats) REQUIRE (s.season, s.conference) IS UNIQUE;""",
+    """CREATE CONSTRAINT team_pair_season_stats_unique IF NOT EXISTS
+        FOR (s:TeamPairSeasonStats) REQUIRE (s.season, s.team1, s.team2) IS UNIQUE;""",
+    """CREATE CONSTRAINT transfer_season_stats_unique IF NOT EXISTS
+        FOR (s:TransferSeasonStats) REQUIRE (s.season, s.fromTeam, s.toTeam) IS UNIQUE;""",
+    """CREATE CONSTRAINT load_version_id_unique IF NOT EXISTS
+        FOR (v:LoadVersion) REQUIRE v.id IS UNIQUE;""",
+]
+
+# Written by every load/sync so readers on other hosts can invalidate caches.
+# A random loadId (not a counter) stays unique even though load_all deletes the node.
+RECORD_LOAD_VERSION_QUERY = """
+    MERGE (v:LoadVersion {id: 'graph'})
+    SET v.loadId = randomUUID(),
+        v.loadedAt = datetime();
+"""
+
+def is_schema_query(query):
+    # Schema commands can't run under PROFILE/EXPLAIN
+    return query.lstrip().upper().startswith(("CREATE CONSTRAINT", "CREATE INDEX", "DROP ", "SHOW "))
+
+def load_connection_settings():
+    load_status = dotenv.load_dotenv(ENV_FILE)
+    if load_status is False:
+        raise RuntimeError("Environment variables not loaded.")
+
+    return {
+        "uri": os.getenv("NEO4J_URI"),
+        "auth": (os.getenv("NEO4J_USERNAME"), os.getenv("NEO4J_PASSWORD")),
+        "database": os.getenv("NEO4J_DATABASE"),
+    }
+
+def node_pattern(label, var, param):
+    props = ", ".join(f"{k}: {param}.{k}" for k in NODE_KEYS[label])
+    return f"({var}:{label} {{{props}}})"
+
+def relationship_pattern(rel_type, merge_keys, var="r", param="row.merge"):
+    if not merge_keys:
+        return f"[{var}:{rel_type}]"
+    props = ", ".join(f"{k}: {param}.{k}" for k in merge_keys)
+    return f"[{var}:{rel_type} {{{props}}}]"
+
+def sync_phases(changes):
+    """
+    Turn a snapshot diff into ordered phases of (query, rows). Queries within a
+    phase are independent; each phase must finish before the next one starts.
+    """
+    node_upserts, rel_deletes, rel_upserts, node_deletes = [], [], [], []
+
+    for label, rows in changes["node_upserts"].items():
+        query = f"""
+            UNWIND $rows AS row
+            MERGE {node_pattern(label, "n", "row.key")}
+            SET n += row.props;
+        """
+        node_upserts.append((query, rows))
+
+    for rel_type, rows in changes["rel_deletes"].items():
+        start_label, end_label, merge_keys = RELATIONSHIPS[rel_type]
+        query = f"""
+            UNWIND $rows AS row
+            MATCH {node_pattern(start_label, "a", "row.start")}
+                  -{relationship_pattern(rel_type, merge_keys)}->
+                  {node_pattern(end_label, "b", "row.end")}
+            DELETE r;
+        """
+        rel_deletes.append((query, rows))
+
+    for rel_type, rows in changes["rel_upserts"].items():
+        start_label, end_label, merge_keys = RELATIONSHIPS[rel_type]
+        query = f"""
+            UNWIND $rows AS row
+            MATCH {node_pattern(start_label, "a", "row.start")}
+            MATCH {node_pattern(end_label, "b", "row.end")}
+            MERGE (a)-{relationship_pattern(rel_type, merge_keys)}->(b)
+            SET r += row.props;
+        """
+        rel_upserts.append((query, rows))
 
-class GraphDBManager:
+    for label, rows in changes["node_deletes"].items():
+        query = f"""
+            UNWIND $rows AS row
+            MATCH {node_pattern(label, "n", "row.key")}
+            DETACH DELETE n;
+        """
+        node_deletes.append((query, rows))
+
+    return [node_upserts, rel_deletes, rel_upserts, node_deletes]
+
+# Step names the sync phases are reported under
+SYNC_PHASES = ["sync_node_upserts", "sync_rel_deletes", "sync_rel_upserts", "sync_node_deletes"]
+
+def sync_queries():
+    """Every statement sync_phases can build, named like "sync_node_upserts[Player]"."""
+    names = [list(NODE_KEYS), list(RELATIONSHIPS), list(RELATIONSHIPS), list(NODE_KEYS)]
+    changes = dict(zip(
+        ["node_upserts", "rel_deletes", "rel_upserts", "node_deletes"],
+        [{name: [] for name in phase_names} for phase_names in names],
+    ))
+    return [
+        (f"{phase}[{name}]", query)
+        for phase, phase_names, queries in zip(SYNC_PHASES, names, sync_phases(changes))
+        for name, (query, _) in zip(phase_names, queries)
+    ]
+
+def print_sync_summary(changes):
+    for change, groups in changes.items():
+        counts = {name: len(rows) for name, rows in groups.items() if rows}
+        print(f"{change}: {counts if counts else 'none'}")
+    print("Graph synced successfully.")
+
+class _QueryRecorder:
     def __init__(self):
-        load_status = dotenv.load_dotenv('Neo4j-b9043243-Created-2025-11-16.txt')
-        if load_status is False:
-            raise RuntimeError("Environment variables not loaded.")
-        
-        URI = os.getenv("NEO4J_URI")
-        AUTH = (os.getenv("NEO4J_USERNAME"), os.getenv("NEO4J_PASSWORD"))
-
-        self.DATABASE = os.getenv("NEO4J_DATABASE")
-        self.driver = GraphDatabase.driver(URI, auth=AUTH)
+        self.queries = []
+
+    def _run(self, query, **params):
+        self.queries.append((query, params))
+
+def step_queries(step):
+    """Return the (query, params) pairs a GraphDBManager loader step runs, without running them."""
+    recorder = _QueryRecorder()
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(GraphDBManager, step)(recorder)
+    return recorder.queries
+
+class GraphDBManager:
+    def __init__(self, profile=False):
+        settings = load_connection_settings()
+
+        self.DATABASE = settings["database"]
+        self.driver = GraphDatabase.driver(settings["uri"], auth=settings["auth"])
         self.driver.verify_connectivity()
+        self._explained = None
+        # Set for the duration of load_all/sync_all; profile runs loader queries under PROFILE
+        self.report = None
+        self.profile = profile
         print("Connected to Neo4j database successfully.")
 
     def close(self):
         self.driver.close()
 
+    def _run(self, query, **params):
+        if self._explained is not None:
+            result = self.driver.execute_query(f"EXPLAIN {query}", database_=self.DATABASE, **params)
+            self._explained.append((query, result.summary.plan))
+            return result
+
+        if self.profile and not is_schema_query(query):
+            query = f"PROFILE {query}"
+        start = time.perf_counter()
+        result = self.driver.execute_query(query, database_=self.DATABASE, **params)
+        if self.report is not None:
+            self.report.record_query(result.summary, time.perf_counter() - start)
+        return result
+
+    def _step(self, name):
+        return self.report.step(name) if self.report is not None else contextlib.nullcontext()
+
+    @contextlib.contextmanager
+    def explaining(self):
+        # Loader steps called inside this block are planned with EXPLAIN but not executed
+        self._explained = []
+        try:
+            yield self._explained
+        finally:
+            self._explained = None
+
+    def create_indexes(self):
+        SchemaManager(self).create_indexes()
+
+    def audit_queries(self):
+        # Planned by SchemaManager.audit alongside the @uses_indexes steps
+        return sync_queries()
+
     def create_constraints(self):
-        queries = [
-            """CREATE CONSTRAINT player_identity_unique IF NOT EXISTS
-                FOR (p:Player) REQUIRE (p.name, p.hometown) IS UNIQUE;""",
-            """CREATE CONSTRAINT coach_identity_unique IF NOT EXISTS
-                FOR (c:Coach) REQUIRE c.name IS UNIQUE;""",
-            """CREATE CONSTRAINT team_name_unique IF NOT EXISTS
-                FOR (t:Team) REQUIRE t.name IS UNIQUE;""",
-            """CREATE CONSTRAINT college_name_unique IF NOT EXISTS
-                FOR (c:College) REQUIRE c.name IS UNIQUE;""",
-            """CREATE CONSTRAINT high_school_name_unique IF NOT EXISTS
-                FOR (hs:HighSchool) REQUIRE hs.name IS UNIQUE;""",
-            """CREATE CONSTRAINT conference_name_unique IF NOT EXISTS   
-                FOR (c:Conference) REQUIRE c.name IS UNIQUE;""",
-            """CREATE CONSTRAINT position_name_unique IF NOT EXISTS   
-                FOR (p:Position) REQUIRE p.name IS UNIQUE;""",
-        ]
-
-        for q in queries:
-            self.driver.execute_query(q, database_=self.DATABASE)
+        for q in CONSTRAINTS:
+            self._run(q)
         print("Constraints created successfully.")
     
+    @uses_indexes(node_index("Player", "playerId"))
     def add_players(self):
         url = f"{RAW_BASE}/players.csv"
 
         query = """
             LOAD CSV WITH HEADERS FROM $url AS row
-            MERGE (p:Player {name: row.Name, hometown: row.Hometown})
-            SET p.height = toInteger(row.Height),
+            MERGE (p:Player {playerId: toInteger(row.`Player ID`)})
+            SET p.name = row.Name,
+                p.hometown = row.Hometown,
+                p.height = toInteger(row.Height),
                 p.weight = toInteger(row.Weight),
                 p.battingHand = row.Batting,
                 p.throwingHand = row.Throwing;
         """
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Players added successfully.")
 
+    @uses_indexes(node_index("Position", "name"))
     def add_positions(self):
         url = f"{RAW_BASE}/positions.csv"
 
@@ -64,9 +260,10 @@ class GraphDBManager:
             LOAD CSV WITH HEADERS FROM $url AS row
             MERGE (p:Position {name: row.name})
         """
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Positions added successfully.")
 
+    @uses_indexes(node_index("Coach", "name"))
     def add_coaches(self):
         url = f"{RAW_BASE}/coaches.csv"
 
@@ -74,9 +271,10 @@ class GraphDBManager:
             LOAD CSV WITH HEADERS FROM $url AS row
             MERGE (c:Coach {name: row.Name});
         """
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Coaches added successfully.")
 
+    @uses_indexes(node_index("Team", "name"))
     def add_teams(self):
         url = f"{RAW_BASE}/teams.csv"
 
@@ -85,9 +283,10 @@ class GraphDBManager:
             MERGE (t:Team {name: row.team});
         """
 
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Teams added successfully.")
 
+    @uses_indexes(node_index("Conference", "name"))
     def add_conferences(self):
         url = f"{RAW_BASE}/conferences.csv"
 
@@ -101,9 +300,10 @@ class GraphDBManager:
                 c.headquarters = row.headquarters;
         """
 
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Conferences added successfully.")
 
+    @uses_indexes(node_index("HighSchool", "name"))
     def add_highschools(self):
         url = f"{RAW_BASE}/highschools.csv"
 
@@ -112,9 +312,10 @@ class GraphDBManager:
             MERGE (hs:HighSchool {name: row.name});
         """
 
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("High Schools added successfully.")
     
+    @uses_indexes(node_index("College", "name"))
     def add_colleges(self):
         url = f"{RAW_BASE}/colleges.csv"
 
@@ -123,15 +324,22 @@ class GraphDBManager:
             MERGE (c:College {name: row.name});
         """
 
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Colleges added successfully.")
 
+    @uses_indexes(
+        node_index("Player", "playerId"),
+        node_index("Team", "name"),
+        node_index("HighSchool", "name"),
+        node_index("Position", "name"),
+        relationship_index("PLAYS_FOR", "season"),
+    )
     def add_player_relationships(self):
         url = f"{RAW_BASE}/players.csv"
 
         query = """
             LOAD CSV WITH HEADERS FROM $url AS row
-            MATCH (p:Player {name: row.Name, hometown: row.Hometown})
+            MATCH (p:Player {playerId: toInteger(row.`Player ID`)})
             MATCH (t:Team {name: row.Team})
 
             MERGE (p)-[r:PLAYS_FOR {season: toInteger(row.Season)}]->(t)
@@ -151,9 +359,14 @@ class GraphDBManager:
             MERGE (p)-[:HAS_POSITION]->(pos);
         """
 
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Player relationships added successfully.")
     
+    @uses_indexes(
+        node_index("Team", "name"),
+        node_index("Conference", "abbreviation"),
+        node_index("College", "name"),
+    )
     def add_team_relationships(self):
         url = f"{RAW_BASE}/teams.csv"
 
@@ -167,9 +380,10 @@ class GraphDBManager:
             MERGE (t)-[:REPRESENTS]->(c);
         """
 
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Team relationships added successfully.")
 
+    @uses_indexes(node_index("Coach", "name"), node_index("Team", "name"))
     def add_coach_relationships(self):
         url = f"{RAW_BASE}/coaches.csv"
 
@@ -181,9 +395,31 @@ class GraphDBManager:
                 r.season = toInteger(row.Season);
         """
 
-        self.driver.execute_query(query, url=url, database_=self.DATABASE)
+        self._run(query, url=url)
         print("Coach relationships added successfully.")
 
+    # Stints are precomputed in process_data.py; firstSeason serves staff-turnover lookups
+    @uses_indexes(
+        node_index("Coach", "name"), node_index("Team", "name"),
+        relationship_index("COACHED_AT", "firstSeason"),
+    )
+    def add_coach_careers(self):
+        url = f"{RAW_BASE}/coach_careers.csv"
+
+        query = """
+            LOAD CSV WITH HEADERS FROM $url AS row
+            MATCH (c:Coach {name: row.Name}), (t:Team {name: row.Team})
+            MERGE (c)-[r:COACHED_AT {firstSeason: toInteger(row.`First Season`)}]->(t)
+            SET r.lastSeason = toInteger(row.`Last Season`),
+                r.seasons = toInteger(row.Seasons),
+                r.roles = split(row.Roles, ' | '),
+                r.previousTeam = row.`Previous Team`;
+        """
+        self._run(query, url=url)
+        print("Coach careers added successfully.")
+
+    # Compares every player's seasons, so scanning all Player nodes is expected
+    @uses_indexes(relationship_index("PLAYS_FOR", "season"), allow=("NodeByLabelScan",))
     def add_transfer_relationships(self):
 
         query = """
@@ -196,31 +432,157 @@ class GraphDBManager:
                 tr.toTeam = t2.name,
                 tr.season = r2.season;
         """
-        self.driver.execute_query(query, database_=self.DATABASE)
+        self._run(query)
         print("Player transfer relationships added successfully.")
 
+    # Summary nodes: the season index serves dashboard lookups such as {season: 2025}
+    @uses_indexes(
+        node_index("HighSchoolSeasonStats", "season", "highSchool"),
+        node_index("HighSchoolSeasonStats", "season"),
+    )
+    def add_high_school_stats(self):
+        url = f"{RAW_BASE}/high_school_stats.csv"
+
+        query = """
+            LOAD CSV WITH HEADERS FROM $url AS row
+            MERGE (s:HighSchoolSeasonStats {season: toInteger(row.Season), highSchool: row.`High School`})
+            SET s.players = toInteger(row.Players);
+        """
+        self._run(query, url=url)
+        print("High school stats added successfully.")
+
+    @uses_indexes(
+        node_index("ConferenceSeasonStats", "season", "conference"),
+        node_index("ConferenceSeasonStats", "season"),
+    )
+    def add_conference_stats(self):
+        url = f"{RAW_BASE}/conference_stats.csv"
+
+        query = """
+            LOAD CSV WITH HEADERS FROM $url AS row
+            MERGE (s:ConferenceSeasonStats {season: toInteger(row.Season), conference: row.Conference})
+            SET s.players = toInteger(row.Players),
+                s.leftHandedBatters = toInteger(row.`Left-Handed Batters`),
+                s.rightHandedBatters = toInteger(row.`Right-Handed Batters`),
+                s.switchHitters = toInteger(row.`Switch Hitters`),
+                s.leftHandedThrowers = toInteger(row.`Left-Handed Throwers`),
+                s.rightHandedThrowers = toInteger(row.`Right-Handed Throwers`),
+                s.leftHandedPitchers = toInteger(row.`Left-Handed Pitchers`);
+        """
+        self._run(query, url=url)
+        print("Conference stats added successfully.")
+
+    @uses_indexes(
+        node_index("TeamPairSeasonStats", "season", "team1", "team2"),
+        node_index("TeamPairSeasonStats", "season"),
+    )
+    def add_shared_high_school_stats(self):
+        url = f"{RAW_BASE}/shared_high_school_stats.csv"
+
+        query = """
+            LOAD CSV WITH HEADERS FROM $url AS row
+            MERGE (s:TeamPairSeasonStats {season: toInteger(row.Season), team1: row.`Team 1`, team2: row.`Team 2`})
+            SET s.sharedHighSchools = toInteger(row.`Shared High Schools`);
+        """
+        self._run(query, url=url)
+        print("Shared high school stats added successfully.")
+
+    @uses_indexes(
+        node_index("TransferSeasonStats", "season", "fromTeam", "toTeam"),
+        node_index("TransferSeasonStats", "season"),
+    )
+    def add_transfer_stats(self):
+        url = f"{RAW_BASE}/transfer_stats.csv"
+
+        query = """
+            LOAD CSV WITH HEADERS FROM $url AS row
+            MERGE (s:TransferSeasonStats {season: toInteger(row.Season), fromTeam: row.`From Team`, toTeam: row.`To Team`})
+            SET s.transfers = toInteger(row.Transfers);
+        """
+        self._run(query, url=url)
+        print("Transfer stats added successfully.")
+
     def delete_all(self):
         query = "MATCH (n) DETACH DELETE n;"
-        self.driver.execute_query(query, database_=self.DATABASE)
+        self._run(query)
         print("All nodes and relationships deleted successfully.")
 
-    def load_all(self):
-        self.delete_all()
-        self.create_constraints()
-        self.add_conferences()
-        self.add_highschools()
-        self.add_teams()
-        self.add_players()
-        self.add_positions()
-        self.add_coaches()
-        self.add_colleges()
-
-        self.add_player_relationships()
-        self.add_team_relationships()
-        self.add_coach_relationships()
-        self.add_transfer_relationships()
-        self.close()
+    def record_load_version(self, version_path=LOAD_VERSION_PATH):
+        with self._step("record_load_version"):
+            self._run(RECORD_LOAD_VERSION_QUERY)
+        bump_load_version(version_path)
+
+    def _write_batches(self, query, rows, batch_size):
+        # One transaction per batch keeps locks short so the graph stays queryable
+        for i in range(0, len(rows), batch_size):
+            self._run(query, rows=rows[i:i + batch_size])
+
+    def sync_all(self, processed_dir=PROCESSED_DIR, state_path=STATE_PATH, batch_size=1000,
+                 version_path=LOAD_VERSION_PATH, report_dir=REPORT_DIR):
+        """
+        Apply only the difference between data/processed/ and the snapshot recorded
+        at the last sync. Without a recorded snapshot every entity is upserted.
+        Runs against a scratch database should pass their own state, version and report paths.
+        """
+        self.report = LoadReport("sync", profile=self.profile)
+        try:
+            with self._step("build_snapshot"):
+                snapshot = build_snapshot(processed_dir)
+                changes = diff_snapshot(load_state(state_path), snapshot)
+
+            with self._step("create_constraints"):
+                self.create_constraints()
+            with self._step("create_indexes"):
+                self.create_indexes()
+
+            for name, phase in zip(SYNC_PHASES, sync_phases(changes)):
+                with self._step(name):
+                    for query, rows in phase:
+                        self._write_batches(query, rows, batch_size)
+
+            save_state(snapshot_state(snapshot), state_path)
+            self.record_load_version(version_path)
+            print_sync_summary(changes)
+            self.report.finish()
+            self.report.print_summary()
+        finally:
+            self.report.write(report_dir)
+            self.report = None
+
+    def load_all(self, state_path=STATE_PATH):
+        self.report = LoadReport("load", profile=self.profile)
+        try:
+            with self._step("build_snapshot"):
+                # Same files LOAD CSV reads, so the next sync diffs against what was actually loaded
+                snapshot = build_snapshot(RAW_BASE)
+            with self._step("delete_all"):
+                self.delete_all()
+            with self._step("create_constraints"):
+                self.create_constraints()
+            with self._step("create_indexes"):
+                self.create_indexes()
+            for step in LOAD_STEPS:
+                with self._step(step):
+                    getattr(self, step)()
+            save_state(snapshot_state(snapshot), state_path)
+            self.record_load_version()
+            self.report.finish()
+            self.report.print_summary()
+        finally:
+            self.report.write()
+            self.report = None
+            self.close()
 
 if __name__ == "__main__":
-    manager = GraphDBManager()
-    manager.load_all()
\ No newline at end of file
+    # python funcs_neo4j.py [sync | audit [--strict]] [--profile]
+    manager = GraphDBManager(profile="--profile" in sys.argv)
+    if len(sys.argv) > 1 and sys.argv[1] == "sync":
+        manager.sync_all()
+        manager.close()
+    elif len(sys.argv) > 1 and sys.argv[1] == "audit":
+        try:
+            SchemaManager(manager).audit(strict="--strict" in sys.argv)
+        finally:
+            manager.close()
+    else:
+        manager.load_all()
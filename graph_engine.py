@@ -0,0 +1,252 @@
+import sys
+import time
+
+import numpy as np
+
+from graph_snapshot import RELATIONSHIPS, PROCESSED_DIR, build_snapshot, entry_key
+
+def build_csr(src, dst, num_nodes):
+    # Stable sort keeps edges of one node in their original order
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+    return indptr, dst[order], order
+
+def gather_ranges(indptr, nodes):
+    # Positions covered by indptr[n]:indptr[n + 1] for every n in nodes, without a Python loop
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.arange(counts.sum()) - offsets + np.repeat(starts, counts)
+    return np.repeat(nodes, counts), positions
+
+class Adjacency:
+    def __init__(self, src, dst, num_start, num_end, props):
+        self.src = src
+        self.dst = dst
+        self.props = props
+        self.out_indptr, self.out_indices, self.out_edges = build_csr(src, dst, num_start)
+        self.in_indptr, self.in_indices, self.in_edges = build_csr(dst, src, num_end)
+
+class CSRGraph:
+    """
+    In-memory, array-backed copy of the knowledge graph built from data/processed/.
+    Every label gets dense integer IDs; every relationship type gets forward and
+    reverse CSR adjacency plus per-edge property arrays.
+    """
+
+    def __init__(self, snapshot):
+        self.keys = {}
+        self.ids = {}
+        self.node_props = {}
+        for label, entries in snapshot['nodes'].items():
+            self.keys[label] = list(entries)
+            self.ids[label] = {k: i for i, k in enumerate(entries)}
+            names = []
+            for entry in entries.values():
+                for prop in [*entry['key'], *entry['props']]:
+                    if prop not in names:
+                        names.append(prop)
+            self.node_props[label] = {
+                prop: np.array([{**e['key'], **e['props']}.get(prop) for e in entries.values()], dtype=object)
+                for prop in names
+            }
+
+        self.adjacency = {}
+        for rel_type, entries in snapshot['relationships'].items():
+            start_label, end_label, _ = RELATIONSHIPS[rel_type]
+            entries = list(entries.values())
+            src = np.array([self.ids[start_label][entry_key(e['start'])] for e in entries], dtype=np.int64)
+            dst = np.array([self.ids[end_label][entry_key(e['end'])] for e in entries], dtype=np.int64)
+            prop_names = {p for e in entries for p in [*e['merge'], *e['props']]}
+            props = {}
+            for prop in prop_names:
+                values = [{**e['merge'], **e['props']}.get(prop) for e in entries]
+                props[prop] = np.empty(len(values), dtype=object)
+                props[prop][:] = values
+            self.adjacency[rel_type] = Adjacency(
+                src, dst, len(self.keys[start_label]), len(self.keys[end_label]), props
+            )
+
+    @classmethod
+    def from_processed(cls, processed_dir=PROCESSED_DIR):
+        return cls(build_snapshot(processed_dir))
+
+    def node_count(self, label):
+        return len(self.keys[label])
+
+    def node_id(self, label, **key):
+        return self.ids[label].get(entry_key(key))
+
+    def node_property(self, label, prop, nodes=None):
+        values = self.node_props[label].get(prop)
+        if values is None:
+            values = np.full(self.node_count(label), None, dtype=object)
+        return values if nodes is None else values[nodes]
+
+    def edge_property(self, rel_type, prop, edges=None):
+        adj = self.adjacency[rel_type]
+        values = adj.props.get(prop)
+        if values is None:
+            # No edge of this type sets the property (e.g. no TRANSFERRED_TO in a one-season league)
+            values = np.full(len(adj.src), None, dtype=object)
+        return values if edges is None else values[edges]
+
+    def degree(self, rel_type, direction='out'):
+        adj = self.adjacency[rel_type]
+        indptr = adj.out_indptr if direction == 'out' else adj.in_indptr
+        return np.diff(indptr)
+
+    def expand(self, rel_type, nodes=None, direction='out'):
+        """
+        One hop along rel_type. Returns (sources, targets, edges) arrays aligned
+        per traversed edge; `nodes` defaults to every node on the source side.
+        """
+        adj = self.adjacency[rel_type]
+        if direction == 'out':
+            indptr, indices, edge_ids = adj.out_indptr, adj.out_indices, adj.out_edges
+        else:
+            indptr, indices, edge_ids = adj.in_indptr, adj.in_indices, adj.in_edges
+        if nodes is None:
+            nodes = np.arange(len(indptr) - 1)
+        sources, positions = gather_ranges(indptr, np.asarray(nodes, dtype=np.int64))
+        return sources, indices[positions], edge_ids[positions]
+
+    def neighbors(self, rel_type, nodes, direction='out'):
+        return np.unique(self.expand(rel_type, nodes, direction)[1])
+
+    def path_pairs(self, rel_types, nodes=None):
+        """
+        Multi-hop traversal: follow (rel_type, direction) steps and return distinct
+        (start, end) ID pairs as two aligned arrays.
+        """
+        starts = None
+        current = None
+        for rel_type, direction in rel_types:
+            if current is None:
+                starts, current, _ = self.expand(rel_type, nodes, direction)
+            else:
+                # Expand each distinct frontier node once, then map back to the starts
+                frontier, inverse = np.unique(current, return_inverse=True)
+                src, dst, _ = self.expand(rel_type, frontier, direction)
+                counts = np.bincount(np.searchsorted(frontier, src), minlength=len(frontier))
+                indptr = np.zeros(len(frontier) + 1, dtype=np.int64)
+                np.cumsum(counts, out=indptr[1:])
+                _, positions = gather_ranges(indptr, inverse)
+                rows = np.repeat(np.arange(len(current)), counts[inverse])
+                starts, current = starts[rows], dst[positions]
+            pairs = np.unique(np.stack([starts, current]), axis=1)
+            starts, current = pairs[0], pairs[1]
+        return starts, current
+
+    def top_high_schools(self, limit=10):
+        counts = self.degree('ATTENDED', 'in')
+        names = self.node_property('HighSchool', 'name')
+        order = np.lexsort((names.astype(str), -counts))[:limit]
+        return [{'highSchool': names[i], 'players': int(counts[i])} for i in order if counts[i] > 0]
+
+    def transfer_counts(self, season=None):
+        from_team = self.edge_property('TRANSFERRED_TO', 'fromTeam').astype(str)
+        to_team = self.edge_property('TRANSFERRED_TO', 'toTeam').astype(str)
+        if season is not None:
+            mask = self.edge_property('TRANSFERRED_TO', 'season') == season
+            from_team, to_team = from_team[mask], to_team[mask]
+        if len(from_team) == 0:
+            return []
+        pairs, counts = np.unique(np.stack([from_team, to_team]), axis=1, return_counts=True)
+        order = np.lexsort((pairs[1], pairs[0], -counts))
+        return [{'fromTeam': str(pairs[0][i]), 'toTeam': str(pairs[1][i]), 'transfers': int(counts[i])} for i in order]
+
+    def left_handed_pitchers_by_conference(self, season=None):
+        position_names = self.node_property('Position', 'name')
+        players, positions, _ = self.expand('HAS_POSITION')
+        throwing = self.node_property('Player', 'throwingHand', players)
+        mask = (position_names[positions] == 'Left-Handed Pitcher') | (
+            (position_names[positions] == 'Pitcher') & (throwing == 'Left')
+        )
+        pitchers = np.unique(players[mask])
+
+        players, teams, edges = self.expand('PLAYS_FOR', pitchers)
+        if season is not None:
+            keep = self.edge_property('PLAYS_FOR', 'season', edges) == season
+            players, teams = players[keep], teams[keep]
+        team_rows, conferences, _ = self.expand('MEMBER_OF', np.unique(teams))
+        conference_of_team = np.full(self.node_count('Team'), -1, dtype=np.int64)
+        conference_of_team[team_rows] = conferences
+        conferences = conference_of_team[teams]
+        keep = conferences >= 0
+        pairs = np.unique(np.stack([players[keep], conferences[keep]]), axis=1)
+
+        counts = np.bincount(pairs[1], minlength=self.node_count('Conference'))
+        names = self.node_property('Conference', 'name')
+        order = np.lexsort((names.astype(str), -counts))
+        return [{'conference': names[i], 'pitchers': int(counts[i])} for i in order if counts[i] > 0]
+
+    def teams_sharing_high_schools(self, limit=20):
+        # Distinct (player, team, high school) rows: every PLAYS_FOR edge joined with the player's ATTENDED edges
+        players, teams, _ = self.expand('PLAYS_FOR')
+        attended = self.degree('ATTENDED')[players]
+        _, high_schools, _ = self.expand('ATTENDED', players)
+        rows = np.unique(np.stack([np.repeat(players, attended), np.repeat(teams, attended), high_schools]), axis=1)
+        players, teams, high_schools = rows
+
+        shape = (self.node_count('Team'), self.node_count('HighSchool'))
+        player_counts = np.zeros(shape, dtype=np.int32)
+        np.add.at(player_counts, (teams, high_schools), 1)
+        sole_player = np.full(shape, -1, dtype=np.int64)
+        sole_player[teams, high_schools] = players
+        sole_player[player_counts != 1] = -1
+
+        # A school links two teams only through two different players (like the two ATTENDED
+        # edges in the Cypher query); subtract pairs whose only link is one player on both teams
+        incidence = (player_counts > 0).astype(np.int32)
+        single_team, single_hs = np.nonzero(sole_player >= 0)
+        single_player = sole_player[single_team, single_hs]
+        order = np.lexsort((single_hs, single_player))
+        single_team, single_hs, single_player = single_team[order], single_hs[order], single_player[order]
+        new_group = np.ones(len(order), dtype=bool)
+        new_group[1:] = (single_player[1:] != single_player[:-1]) | (single_hs[1:] != single_hs[:-1])
+        group = np.cumsum(new_group) - 1
+        indptr = np.zeros(new_group.sum() + 1, dtype=np.int64)
+        np.cumsum(np.bincount(group, minlength=len(indptr) - 1), out=indptr[1:])
+        # Every ordered pair of teams within a (player, school) group
+        _, positions = gather_ranges(indptr, group)
+        first = np.repeat(single_team, np.diff(indptr)[group])
+        second = single_team[positions]
+        same_player = np.zeros((shape[0], shape[0]), dtype=np.int32)
+        np.add.at(same_player, (first, second), 1)
+
+        shared = np.triu(incidence @ incidence.T - same_player, k=1)
+
+        team1, team2 = np.nonzero(shared)
+        counts = shared[team1, team2]
+        team_names = self.node_property('Team', 'name').astype(str)
+        hs_names = self.node_property('HighSchool', 'name')
+        swap = team_names[team1] > team_names[team2]
+        team1, team2 = np.where(swap, team2, team1), np.where(swap, team1, team2)
+
+        order = np.lexsort((team_names[team2], team_names[team1], -counts))[:limit]
+        results = []
+        for i in order:
+            t1, t2 = team1[i], team2[i]
+            both = incidence[t1].astype(bool) & incidence[t2].astype(bool)
+            both &= ~((sole_player[t1] >= 0) & (sole_player[t1] == sole_player[t2]))
+            results.append({
+                'team1': str(team_names[t1]),
+                'team2': str(team_names[t2]),
+                'sharedHighSchools': int(counts[i]),
+                'highSchools': list(hs_names[np.nonzero(both)[0]]),
+            })
+        return results
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    graph = CSRGraph.from_processed(sys.argv[1] if len(sys.argv) > 1 else PROCESSED_DIR)
+    print(f"Built in-memory graph in {(time.perf_counter() - start) * 1000:.0f} ms.")
+
+    for name in ['top_high_schools', 'transfer_counts', 'left_handed_pitchers_by_conference', 'teams_sharing_high_schools']:
+        start = time.perf_counter()
+        rows = getattr(graph, name)()
+        print(f"\n{name} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        for row in rows[:5]:
+            print(row)
@@ -0,0 +1,223 @@
+import os
+import sys
+import threading
+import time
+
+from neo4j import GraphDatabase, RoutingControl
+
+from funcs_neo4j import load_connection_settings
+
+# Single-node index lookup on the marker written by every load/sync (funcs_neo4j.RECORD_LOAD_VERSION_QUERY)
+LOAD_VERSION_QUERY = "MATCH (v:LoadVersion {id: 'graph'}) RETURN v.loadId AS loadId;"
+
+# Named analyses from the README. `params` are the defaults callers may override.
+NAMED_QUERIES = {
+    "top_high_schools": {
+        "query": """
+            MATCH (p:Player)-[:ATTENDED]->(hs:HighSchool)
+            RETURN hs.name AS highSchool, count(DISTINCT p) AS players
+            ORDER BY players DESC, highSchool
+            LIMIT $limit;
+        """,
+        "params": {"limit": 10},
+    },
+    "transfer_counts": {
+        "query": """
+            MATCH (p:Player)-[tr:TRANSFERRED_TO]->(:Team)
+            WHERE $season IS NULL OR tr.season = $season
+            RETURN tr.fromTeam AS fromTeam, tr.toTeam AS toTeam, count(p) AS transfers
+            ORDER BY transfers DESC, fromTeam, toTeam;
+        """,
+        "params": {"season": None},
+    },
+    "left_handed_pitchers_by_conference": {
+        "query": """
+            MATCH (p:Player)-[:HAS_POSITION]->(pos:Position)
+            WHERE pos.name = 'Left-Handed Pitcher'
+               OR (pos.name = 'Pitcher' AND p.throwingHand = 'Left')
+            MATCH (p)-[r:PLAYS_FOR]->(:Team)-[:MEMBER_OF]->(c:Conference)
+            WHERE $season IS NULL OR r.season = $season
+            RETURN c.name AS conference, count(DISTINCT p) AS pitchers
+            ORDER BY pitchers DESC, conference;
+        """,
+        "params": {"season": None},
+    },
+    "teams_sharing_high_schools": {
+        "query": """
+            MATCH (t1:Team)<-[:PLAYS_FOR]-(:Player)-[:ATTENDED]->(hs:HighSchool)
+                  <-[:ATTENDED]-(:Player)-[:PLAYS_FOR]->(t2:Team)
+            WHERE t1.name < t2.name
+            RETURN t1.name AS team1, t2.name AS team2,
+                   count(DISTINCT hs) AS sharedHighSchools,
+                   collect(DISTINCT hs.name) AS highSchools
+            ORDER BY sharedHighSchools DESC, team1, team2
+            LIMIT $limit;
+        """,
+        "params": {"limit": 20},
+    },
+    # Single-label lookups on the per-season summary nodes built in process_data.py.
+    # season=None (the default) means the latest season loaded, so dashboards follow new data.
+    "high_school_players_summary": {
+        "query": """
+            MATCH (latest:HighSchoolSeasonStats)
+            WITH coalesce($season, max(latest.season)) AS season
+            MATCH (s:HighSchoolSeasonStats {season: season})
+            RETURN s.highSchool AS highSchool, s.players AS players
+            ORDER BY players DESC, highSchool
+            LIMIT $limit;
+        """,
+        "params": {"season": None, "limit": 10},
+    },
+    "conference_handedness_summary": {
+        "query": """
+            MATCH (latest:ConferenceSeasonStats)
+            WITH coalesce($season, max(latest.season)) AS season
+            MATCH (s:ConferenceSeasonStats {season: season})
+            RETURN s.conference AS conference, s.players AS players,
+                   s.leftHandedBatters AS leftHandedBatters, s.rightHandedBatters AS rightHandedBatters,
+                   s.switchHitters AS switchHitters, s.leftHandedThrowers AS leftHandedThrowers,
+                   s.rightHandedThrowers AS rightHandedThrowers, s.leftHandedPitchers AS leftHandedPitchers
+            ORDER BY leftHandedPitchers DESC, conference;
+        """,
+        "params": {"season": None},
+    },
+    "shared_high_schools_summary": {
+        "query": """
+            MATCH (latest:TeamPairSeasonStats)
+            WITH coalesce($season, max(latest.season)) AS season
+            MATCH (s:TeamPairSeasonStats {season: season})
+            RETURN s.team1 AS team1, s.team2 AS team2, s.sharedHighSchools AS sharedHighSchools
+            ORDER BY sharedHighSchools DESC, team1, team2
+            LIMIT $limit;
+        """,
+        "params": {"season": None, "limit": 20},
+    },
+    "transfer_summary": {
+        "query": """
+            MATCH (latest:TransferSeasonStats)
+            WITH coalesce($season, max(latest.season)) AS season
+            MATCH (s:TransferSeasonStats {season: season})
+            RETURN s.fromTeam AS fromTeam, s.toTeam AS toTeam, s.transfers AS transfers
+            ORDER BY transfers DESC, fromTeam, toTeam;
+        """,
+        "params": {"season": None},
+    },
+    # Coaching stints precomputed in process_data.aggregate_coach_careers
+    "coach_moves": {
+        "query": """
+            MATCH (c:Coach)-[s:COACHED_AT]->(t:Team)
+            WHERE s.previousTeam IS NOT NULL AND ($season IS NULL OR s.firstSeason = $season)
+            RETURN c.name AS coach, s.previousTeam AS fromTeam, t.name AS toTeam,
+                   s.firstSeason AS season, s.roles AS roles
+            ORDER BY season, coach;
+        """,
+        "params": {"season": None},
+    },
+    "coaching_tree": {
+        "query": """
+            MATCH (hc:Coach {name: $headCoach})-[h:COACHED_AT]->(t:Team)<-[s:COACHED_AT]-(c:Coach)
+            WHERE 'Head Coach' IN h.roles AND c <> hc
+              AND s.firstSeason <= h.lastSeason AND s.lastSeason >= h.firstSeason
+            RETURN c.name AS coach, t.name AS team, s.roles AS roles,
+                   s.firstSeason AS firstSeason, s.lastSeason AS lastSeason
+            ORDER BY team, firstSeason, coach;
+        """,
+        "params": {"headCoach": None},
+    },
+}
+
+class QueryService:
+    """
+    Long-lived read service: one driver and connection pool for the process, and
+    results cached per (query, params, load version). The load version is the
+    :LoadVersion node every load/sync rewrites, so loaders on other hosts still
+    invalidate the cache. It is re-read at most every `version_check_interval`
+    seconds; in between, cache hits never touch the database.
+    """
+
+    def __init__(self, max_connection_pool_size=None, version_check_interval=1.0):
+        settings = load_connection_settings()
+
+        pool_config = {}
+        max_connection_pool_size = max_connection_pool_size or os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE")
+        if max_connection_pool_size:
+            pool_config["max_connection_pool_size"] = int(max_connection_pool_size)
+
+        self.DATABASE = settings["database"]
+        self.driver = GraphDatabase.driver(settings["uri"], auth=settings["auth"], **pool_config)
+        self.driver.verify_connectivity()
+        print("Connected to Neo4j database successfully.")
+
+        self.version_check_interval = version_check_interval
+        self._version = None
+        self._version_checked_at = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.driver.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def load_version(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._version_checked_at is not None and now - self._version_checked_at < self.version_check_interval:
+                return self._version
+
+        records, _, _ = self.driver.execute_query(
+            LOAD_VERSION_QUERY, database_=self.DATABASE, routing_=RoutingControl.READ
+        )
+        with self._lock:
+            self._version = records[0]["loadId"] if records else None
+            self._version_checked_at = now
+            return self._version
+
+    def run(self, name, **params):
+        if name not in NAMED_QUERIES:
+            raise ValueError(f"Unknown query: {name}")
+        spec = NAMED_QUERIES[name]
+        unknown = set(params) - set(spec["params"])
+        if unknown:
+            raise ValueError(f"Unknown parameters for {name}: {', '.join(sorted(unknown))}")
+        params = {**spec["params"], **params}
+
+        version = self.load_version()
+        key = (name, tuple(sorted(params.items())))
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] == version:
+            return [dict(row) for row in cached[1]]
+
+        records, _, _ = self.driver.execute_query(
+            spec["query"], params, database_=self.DATABASE, routing_=RoutingControl.READ
+        )
+        rows = [record.data() for record in records]
+        # A graph loaded before the :LoadVersion marker existed can't be invalidated; don't cache it
+        if version is not None:
+            with self._lock:
+                self._cache[key] = (version, rows)
+        return [dict(row) for row in rows]
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+if __name__ == "__main__":
+    # python graph_queries.py <query name> [param=value ...]
+    if len(sys.argv) < 2 or sys.argv[1] not in NAMED_QUERIES:
+        print(f"Usage: python graph_queries.py {{{','.join(NAMED_QUERIES)}}} [param=value ...]")
+        sys.exit(1)
+
+    params = {}
+    for arg in sys.argv[2:]:
+        k, v = arg.split("=", 1)
+        params[k] = int(v) if v.lstrip("-").isdigit() else v
+
+    with QueryService() as service:
+        for row in service.run(sys.argv[1], **params):
+            print(row)
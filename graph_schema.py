@@ -0,0 +1,116 @@
+import contextlib
+import io
+
+# Plan operators that mean a loader query is not anchored on an index
+SCAN_OPERATORS = {"NodeByLabelScan", "AllNodesScan"}
+# Eager materializes every input row before writing, which blows up memory on large loads
+EAGER_OPERATORS = {"Eager"}
+
+def node_index(label, *properties):
+    return {"entity": "NODE", "labelOrType": label, "properties": tuple(properties)}
+
+def relationship_index(rel_type, *properties):
+    return {"entity": "RELATIONSHIP", "labelOrType": rel_type, "properties": tuple(properties)}
+
+def index_name(index):
+    return f"{index['labelOrType'].lower()}_{'_'.join(index['properties'])}_index".replace(" ", "_")
+
+def index_key(index):
+    return (index["entity"], (index["labelOrType"],), index["properties"])
+
+def uses_indexes(*indexes, allow=()):
+    """
+    Mark a GraphDBManager method as a loader query, declaring the indexes its
+    MATCH/MERGE lookups rely on and any plan operators it is allowed to use.
+    """
+    def decorate(fn):
+        fn.required_indexes = indexes
+        fn.allowed_operators = set(allow)
+        return fn
+    return decorate
+
+def loader_steps(manager):
+    cls = manager if isinstance(manager, type) else type(manager)
+    return [name for name in dir(cls) if hasattr(getattr(cls, name), "required_indexes")]
+
+def plan_operators(plan):
+    # summary.plan is a nested dict; operator types look like "NodeByLabelScan@neo4j"
+    yield plan["operatorType"].split("@")[0]
+    for child in plan.get("children", []):
+        yield from plan_operators(child)
+
+def required_indexes(manager):
+    indexes = {}
+    for name in loader_steps(manager):
+        for index in getattr(manager, name).required_indexes:
+            indexes.setdefault(index_key(index), index)
+    return list(indexes.values())
+
+SHOW_INDEXES_QUERY = "SHOW INDEXES YIELD entityType, labelsOrTypes, properties"
+
+def missing_indexes(manager, index_records):
+    # Constraint-backed indexes show up in SHOW INDEXES too, so they satisfy requirements
+    existing = {
+        (r["entityType"], tuple(r["labelsOrTypes"] or ()), tuple(r["properties"] or ()))
+        for r in index_records
+    }
+    return [index for index in required_indexes(manager) if index_key(index) not in existing]
+
+def create_index_query(index):
+    props = ", ".join(f"x.{p}" for p in index["properties"])
+    if index["entity"] == "NODE":
+        pattern = f"(x:{index['labelOrType']})"
+    else:
+        pattern = f"()-[x:{index['labelOrType']}]-()"
+    return f"CREATE INDEX {index_name(index)} IF NOT EXISTS FOR {pattern} ON ({props});"
+
+class SchemaManager:
+    def __init__(self, manager):
+        self.manager = manager
+
+    # Through the manager's _run, so the create_indexes step's queries and indexes_added are reported
+    def missing_indexes(self):
+        records, _, _ = self.manager._run(SHOW_INDEXES_QUERY)
+        return missing_indexes(self.manager, records)
+
+    def create_indexes(self):
+        for index in self.missing_indexes():
+            self.manager._run(create_index_query(index))
+        print("Indexes created successfully.")
+
+    def audit(self, strict=False):
+        """
+        EXPLAIN every loader query and report missing indexes, label/all-node
+        scans and eager operators. Besides the @uses_indexes steps this plans the
+        manager's audit_queries() (the UNWIND statements sync runs) with no rows.
+        Raises in strict mode, otherwise warns.
+        """
+        problems = []
+
+        def check(name, plans, allowed=()):
+            for _, plan in plans:
+                flagged = (set(plan_operators(plan)) & (SCAN_OPERATORS | EAGER_OPERATORS)) - set(allowed)
+                for op in sorted(flagged):
+                    problems.append(f"{name}: plan contains {op}")
+
+        for index in self.missing_indexes():
+            problems.append(f"missing index {index_name(index)} on {index['labelOrType']}{index['properties']}")
+
+        for name in loader_steps(self.manager):
+            method = getattr(self.manager, name)
+            with self.manager.explaining() as plans, contextlib.redirect_stdout(io.StringIO()):
+                method()
+            check(name, plans, method.allowed_operators)
+
+        for name, query in self.manager.audit_queries():
+            with self.manager.explaining() as plans:
+                self.manager._run(query, rows=[])
+            check(name, plans)
+
+        if problems and strict:
+            raise RuntimeError("Schema audit failed:\n" + "\n".join(problems))
+        for problem in problems:
+            print(f"WARNING: {problem}")
+        if not problems:
+            print("Schema audit passed.")
+        return problems
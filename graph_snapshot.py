@@ -0,0 +1,299 @@
+import hashlib
+import json
+import os
+
+PROCESSED_DIR = 'data/processed'
+STATE_PATH = 'data/graph_state.json'
+LOAD_VERSION_PATH = 'data/load_version'
+
+# Properties that identify each node label (mirrors create_constraints)
+NODE_KEYS = {
+    'Player': ('playerId',),
+    'Coach': ('name',),
+    'Team': ('name',),
+    'College': ('name',),
+    'HighSchool': ('name',),
+    'Conference': ('name',),
+    'Position': ('name',),
+    # Per-season rollups computed in process_data.compute_aggregates
+    'HighSchoolSeasonStats': ('season', 'highSchool'),
+    'ConferenceSeasonStats': ('season', 'conference'),
+    'TeamPairSeasonStats': ('season', 'team1', 'team2'),
+    'TransferSeasonStats': ('season', 'fromTeam', 'toTeam'),
+}
+
+# Relationship type -> (start label, end label, properties in the MERGE pattern)
+RELATIONSHIPS = {
+    'PLAYS_FOR': ('Player', 'Team', ('season',)),
+    'ATTENDED': ('Player', 'HighSchool', ()),
+    'HAS_POSITION': ('Player', 'Position', ()),
+    'COACHES': ('Coach', 'Team', ()),
+    'MEMBER_OF': ('Team', 'Conference', ()),
+    'REPRESENTS': ('Team', 'College', ()),
+    'TRANSFERRED_TO': ('Player', 'Team', ()),
+    # Coaching stints from process_data.aggregate_coach_careers
+    'COACHED_AT': ('Coach', 'Team', ('firstSeason',)),
+}
+
+def read_processed(name, processed_dir=PROCESSED_DIR):
+    # Imported here so state/version helpers stay cheap to import (see cli.py status)
+    import pandas as pd
+
+    # processed_dir may also be a URL (funcs_neo4j.RAW_BASE) so a snapshot can match a LOAD CSV load
+    path = f'{processed_dir}/{name}.csv' if '://' in processed_dir else os.path.join(processed_dir, f'{name}.csv')
+    df = pd.read_csv(path, dtype=str, encoding='utf-8-sig')
+    # LOAD CSV hands empty fields to Cypher as null
+    return df.astype(object).where(df.notna(), None)
+
+def to_int(val):
+    # Same leniency as Cypher's toInteger(): unparsable values become null
+    if val is None:
+        return None
+    try:
+        return int(float(val))
+    except ValueError:
+        return None
+
+def position_columns(players_df):
+    return [c for c in players_df.columns if c.startswith('position') and c[len('position'):].isdigit()]
+
+def entry_key(key):
+    return json.dumps(key, sort_keys=True)
+
+def entry_hash(entry):
+    return hashlib.sha1(json.dumps(entry, sort_keys=True).encode('utf-8')).hexdigest()
+
+def build_snapshot(processed_dir=PROCESSED_DIR):
+    """
+    Build the graph the loader would produce from data/processed/ as plain dicts:
+    nodes[label][key] = {'key', 'props'} and
+    relationships[type][key] = {'start', 'end', 'merge', 'props'}.
+    Later rows overwrite earlier ones, like repeated MERGE ... SET in Cypher.
+    """
+    players_df = read_processed('players', processed_dir)
+    coaches_df = read_processed('coaches', processed_dir)
+    teams_df = read_processed('teams', processed_dir)
+    conferences_df = read_processed('conferences', processed_dir)
+    highschools_df = read_processed('highschools', processed_dir)
+    colleges_df = read_processed('colleges', processed_dir)
+    positions_df = read_processed('positions', processed_dir)
+    high_school_stats_df = read_processed('high_school_stats', processed_dir)
+    conference_stats_df = read_processed('conference_stats', processed_dir)
+    shared_high_school_stats_df = read_processed('shared_high_school_stats', processed_dir)
+    transfer_stats_df = read_processed('transfer_stats', processed_dir)
+    coach_careers_df = read_processed('coach_careers', processed_dir)
+
+    nodes = {label: {} for label in NODE_KEYS}
+    relationships = {rel_type: {} for rel_type in RELATIONSHIPS}
+
+    def add_node(label, props):
+        key = {k: props[k] for k in NODE_KEYS[label]}
+        if any(v is None for v in key.values()):
+            return None
+        entry = nodes[label].setdefault(entry_key(key), {'key': key, 'props': {}})
+        entry['props'].update({k: v for k, v in props.items() if k not in key})
+        return key
+
+    def find_node(label, **key):
+        return key if entry_key(key) in nodes[label] else None
+
+    def add_relationship(rel_type, start, end, merge=None, props=None):
+        # Relationships are only created when both endpoints MATCH
+        if start is None or end is None:
+            return
+        merge = merge or {}
+        entry = relationships[rel_type].setdefault(
+            entry_key([start, end, merge]),
+            {'start': start, 'end': end, 'merge': merge, 'props': {}},
+        )
+        entry['props'].update(props or {})
+
+    for row in conferences_df.to_dict('records'):
+        add_node('Conference', {
+            'name': row['name'],
+            'region': row['region'],
+            'abbreviation': row['abbreviation'],
+            'foundedYear': row['founded year'],
+            'numberOfTeams': row['number of teams'],
+            'headquarters': row['headquarters'],
+        })
+    for row in highschools_df.to_dict('records'):
+        add_node('HighSchool', {'name': row['name']})
+    for row in teams_df.to_dict('records'):
+        add_node('Team', {'name': row['team']})
+    for row in positions_df.to_dict('records'):
+        add_node('Position', {'name': row['name']})
+    for row in colleges_df.to_dict('records'):
+        add_node('College', {'name': row['name']})
+    for row in coaches_df.to_dict('records'):
+        add_node('Coach', {'name': row['Name']})
+
+    for row in high_school_stats_df.to_dict('records'):
+        add_node('HighSchoolSeasonStats', {
+            'season': to_int(row['Season']),
+            'highSchool': row['High School'],
+            'players': to_int(row['Players']),
+        })
+    for row in conference_stats_df.to_dict('records'):
+        add_node('ConferenceSeasonStats', {
+            'season': to_int(row['Season']),
+            'conference': row['Conference'],
+            'players': to_int(row['Players']),
+            'leftHandedBatters': to_int(row['Left-Handed Batters']),
+            'rightHandedBatters': to_int(row['Right-Handed Batters']),
+            'switchHitters': to_int(row['Switch Hitters']),
+            'leftHandedThrowers': to_int(row['Left-Handed Throwers']),
+            'rightHandedThrowers': to_int(row['Right-Handed Throwers']),
+            'leftHandedPitchers': to_int(row['Left-Handed Pitchers']),
+        })
+    for row in shared_high_school_stats_df.to_dict('records'):
+        add_node('TeamPairSeasonStats', {
+            'season': to_int(row['Season']),
+            'team1': row['Team 1'],
+            'team2': row['Team 2'],
+            'sharedHighSchools': to_int(row['Shared High Schools']),
+        })
+    for row in transfer_stats_df.to_dict('records'):
+        add_node('TransferSeasonStats', {
+            'season': to_int(row['Season']),
+            'fromTeam': row['From Team'],
+            'toTeam': row['To Team'],
+            'transfers': to_int(row['Transfers']),
+        })
+
+    pos_cols = position_columns(players_df)
+    for row in players_df.to_dict('records'):
+        player = add_node('Player', {
+            'playerId': to_int(row['Player ID']),
+            'name': row['Name'],
+            'hometown': row['Hometown'],
+            'height': to_int(row['Height']),
+            'weight': to_int(row['Weight']),
+            'battingHand': row['Batting'],
+            'throwingHand': row['Throwing'],
+        })
+        positions = [row[c] for c in pos_cols if row[c] not in (None, '')]
+
+        add_relationship(
+            'PLAYS_FOR', player, find_node('Team', name=row['Team']),
+            merge={'season': to_int(row['Season'])},
+            props={
+                'jerseyNumber': to_int(row['Jersey']),
+                'classYear': row['Class Year'],
+                'positions': positions,
+            },
+        )
+        add_relationship('ATTENDED', player, find_node('HighSchool', name=row['High School']))
+        for pos in positions:
+            add_relationship('HAS_POSITION', player, find_node('Position', name=pos))
+
+    conference_by_abbr = {
+        entry['props']['abbreviation']: entry['key'] for entry in nodes['Conference'].values()
+    }
+    for row in teams_df.to_dict('records'):
+        team = find_node('Team', name=row['team'])
+        add_relationship('MEMBER_OF', team, conference_by_abbr.get(row['member of']))
+        add_relationship('REPRESENTS', team, find_node('College', name=row['college']))
+
+    for row in coaches_df.to_dict('records'):
+        add_relationship(
+            'COACHES', find_node('Coach', name=row['Name']), find_node('Team', name=row['Team']),
+            props={'role': row['Role List'], 'season': to_int(row['Season'])},
+        )
+
+    for row in coach_careers_df.to_dict('records'):
+        add_relationship(
+            'COACHED_AT', find_node('Coach', name=row['Name']), find_node('Team', name=row['Team']),
+            merge={'firstSeason': to_int(row['First Season'])},
+            props={
+                'lastSeason': to_int(row['Last Season']),
+                'seasons': to_int(row['Seasons']),
+                'roles': row['Roles'].split(' | ') if row['Roles'] else [],
+                'previousTeam': row['Previous Team'],
+            },
+        )
+
+    # Player played for t1 in season s and for a different t2 in season s + 1
+    stints = {}
+    for entry in relationships['PLAYS_FOR'].values():
+        season = entry['merge']['season']
+        if season is not None:
+            stints.setdefault(entry_key(entry['start']), []).append((season, entry['end']['name'], entry['start']))
+    for player_stints in stints.values():
+        player_stints.sort(key=lambda s: (s[0], s[1]))
+        for season1, team1, player in player_stints:
+            for season2, team2, _ in player_stints:
+                if team1 != team2 and season1 + 1 == season2:
+                    add_relationship(
+                        'TRANSFERRED_TO', player, {'name': team2},
+                        props={'fromTeam': team1, 'toTeam': team2, 'season': season2},
+                    )
+
+    return {'nodes': nodes, 'relationships': relationships}
+
+def snapshot_state(snapshot):
+    # Content hash per node key and per relationship key
+    return {
+        section: {
+            name: {k: entry_hash(entry) for k, entry in entries.items()}
+            for name, entries in snapshot[section].items()
+        }
+        for section in ('nodes', 'relationships')
+    }
+
+def load_state(state_path=STATE_PATH):
+    if not os.path.exists(state_path):
+        return {'nodes': {}, 'relationships': {}}
+    with open(state_path, encoding='utf-8') as file:
+        return json.load(file)
+
+def save_state(state, state_path=STATE_PATH):
+    tmp_path = f'{state_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(state, file, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+def diff_snapshot(state, snapshot):
+    """
+    Compare a snapshot with the state recorded at the last load.
+    Returns upserts (new or changed entries) and deletes (keys no longer present).
+    """
+    changes = {'node_upserts': {}, 'node_deletes': {}, 'rel_upserts': {}, 'rel_deletes': {}}
+
+    for label, entries in snapshot['nodes'].items():
+        previous = state['nodes'].get(label, {})
+        changes['node_upserts'][label] = [
+            entry for k, entry in entries.items() if previous.get(k) != entry_hash(entry)
+        ]
+        changes['node_deletes'][label] = [
+            {'key': json.loads(k)} for k in previous if k not in entries
+        ]
+
+    for rel_type, entries in snapshot['relationships'].items():
+        previous = state['relationships'].get(rel_type, {})
+        changes['rel_upserts'][rel_type] = [
+            entry for k, entry in entries.items() if previous.get(k) != entry_hash(entry)
+        ]
+        deletes = []
+        for k in previous:
+            if k not in entries:
+                start, end, merge = json.loads(k)
+                deletes.append({'start': start, 'end': end, 'merge': merge})
+        changes['rel_deletes'][rel_type] = deletes
+
+    return changes
+
+def read_load_version(version_path=LOAD_VERSION_PATH):
+    if not os.path.exists(version_path):
+        return 0
+    with open(version_path, encoding='utf-8') as file:
+        return int(file.read().strip() or 0)
+
+def bump_load_version(version_path=LOAD_VERSION_PATH):
+    # Readers key cached query results on this number, so bump it after every load
+    version = read_load_version(version_path) + 1
+    tmp_path = f'{version_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(str(version))
+    os.replace(tmp_path, version_path)
+    return version
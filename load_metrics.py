@@ -0,0 +1,159 @@
+import contextlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+REPORT_DIR = 'reports'
+METRIC_PREFIX = 'diamond_load'
+
+# SummaryCounters attributes copied into every step
+COUNTERS = [
+    'nodes_created',
+    'nodes_deleted',
+    'relationships_created',
+    'relationships_deleted',
+    'properties_set',
+    'labels_added',
+    'labels_removed',
+    'indexes_added',
+    'constraints_added',
+]
+
+def profile_operators(profile):
+    # summary.profile is a nested dict; flatten it to one entry per operator
+    if not profile:
+        return []
+    operators = [{
+        'operator': profile['operatorType'].split('@')[0],
+        'dbHits': profile.get('dbHits', 0),
+        'rows': profile.get('rows', 0),
+    }]
+    for child in profile.get('children', []):
+        operators.extend(profile_operators(child))
+    return operators
+
+def new_step(name):
+    return {
+        'step': name,
+        'wall_time_s': 0.0,
+        'queries': 0,
+        'query_time_s': 0.0,
+        'result_available_after_ms': 0,
+        'result_consumed_after_ms': 0,
+        'counters': {c: 0 for c in COUNTERS},
+        'db_hits': 0,
+        'profile': [],
+    }
+
+class LoadReport:
+    """
+    Per-run record of loader steps: wall time, server-side timings and write
+    counters from each query's ResultSummary, plus db hits per operator when
+    queries run under PROFILE.
+    """
+
+    def __init__(self, run, profile=False):
+        self.run = run
+        self.profile = profile
+        self.started_at = datetime.now(timezone.utc)
+        self.steps = []
+        self._current = None
+        self._start = time.perf_counter()
+        self.total_time_s = None
+
+    @contextlib.contextmanager
+    def step(self, name):
+        entry = new_step(name)
+        self._current = entry
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry['wall_time_s'] = time.perf_counter() - start
+            self.steps.append(entry)
+            self._current = None
+
+    def record_query(self, summary, elapsed):
+        entry = self._current
+        if entry is None:
+            entry = new_step('unattributed')
+            self.steps.append(entry)
+
+        entry['queries'] += 1
+        entry['query_time_s'] += elapsed
+        entry['result_available_after_ms'] += summary.result_available_after or 0
+        entry['result_consumed_after_ms'] += summary.result_consumed_after or 0
+        for c in COUNTERS:
+            entry['counters'][c] += getattr(summary.counters, c)
+
+        operators = profile_operators(summary.profile)
+        entry['profile'].extend(operators)
+        entry['db_hits'] += sum(op['dbHits'] for op in operators)
+
+    def finish(self):
+        self.total_time_s = time.perf_counter() - self._start
+
+    def to_dict(self):
+        return {
+            'run': self.run,
+            'started_at': self.started_at.isoformat(),
+            'total_time_s': self.total_time_s,
+            'profile': self.profile,
+            'steps': self.steps,
+        }
+
+    def to_prometheus(self):
+        lines = []
+
+        def metric(name, help_text, values):
+            lines.append(f'# HELP {METRIC_PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {METRIC_PREFIX}_{name} gauge')
+            for labels, value in values:
+                label_str = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f'{METRIC_PREFIX}_{name}{{{label_str}}} {value}')
+
+        def per_step(get):
+            return [({'run': self.run, 'step': s['step']}, get(s)) for s in self.steps]
+
+        metric('run_seconds', 'Wall time of the whole run.', [({'run': self.run}, self.total_time_s or 0)])
+        metric('run_timestamp_seconds', 'Unix time the run started.', [({'run': self.run}, self.started_at.timestamp())])
+        metric('step_seconds', 'Wall time per loader step.', per_step(lambda s: s['wall_time_s']))
+        metric('step_queries', 'Queries executed per loader step.', per_step(lambda s: s['queries']))
+        metric('step_result_available_after_ms', 'Server time until the first record was available.',
+               per_step(lambda s: s['result_available_after_ms']))
+        metric('step_result_consumed_after_ms', 'Server time until all records were consumed.',
+               per_step(lambda s: s['result_consumed_after_ms']))
+        for c in COUNTERS:
+            metric(f'step_{c}', f'{c.replace("_", " ").capitalize()} per loader step.', per_step(lambda s, c=c: s['counters'][c]))
+        if self.profile:
+            metric('step_db_hits', 'Database hits per loader step (PROFILE).', per_step(lambda s: s['db_hits']))
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, out_dir=REPORT_DIR):
+        if self.total_time_s is None:
+            self.finish()
+        os.makedirs(out_dir, exist_ok=True)
+        stamp = self.started_at.strftime('%Y%m%dT%H%M%SZ')
+        json_path = os.path.join(out_dir, f'{self.run}-{stamp}.json')
+        prom_path = os.path.join(out_dir, f'{self.run}-{stamp}.prom')
+
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2)
+        with open(prom_path, 'w', encoding='utf-8') as file:
+            file.write(self.to_prometheus())
+
+        print(f"Load report written to {json_path} and {prom_path}.")
+        return json_path, prom_path
+
+    def print_summary(self):
+        for s in self.steps:
+            counters = s['counters']
+            print(
+                f"{s['step']:<32} {s['wall_time_s']:8.2f}s  "
+                f"nodes +{counters['nodes_created']}/-{counters['nodes_deleted']}  "
+                f"rels +{counters['relationships_created']}/-{counters['relationships_deleted']}  "
+                f"props {counters['properties_set']}"
+                + (f"  dbHits {s['db_hits']}" if self.profile else '')
+            )
@@ -1,7 +1,116 @@
 from rapidfuzz import fuzz, process
+import contextlib
+import os
 import re
+import numpy as np
 import pandas as pd
 
+# Raw-record validation. Every check is an isin/map hash lookup over a whole column,
+# so a frame is validated without calling Python once per row.
+MISSING_VALUES = ['', 'N/A', 'NA', 'n/a', 'TBA', '-', '--']
+
+def int_values(low, high):
+    # Parsing and range check in one lookup (much faster than pd.to_numeric on strings)
+    table = {str(i): i for i in range(low, high + 1)}
+    table.update({str(i).zfill(2): i for i in range(max(low, 0), min(high, 9) + 1)})
+    return table
+
+def height_values(low, high):
+    # Inches ("74") or feet-inches as printed on roster pages: 6'2", 6'2'', 6' 2, 6-2, curly quotes and primes
+    table = int_values(low, high)
+    feet_marks = ["'", "’", "′"]
+    inch_marks = ['', '"', "''", "”", "’’", "″", "′′"]
+    for inches in range(low, high + 1):
+        feet, rest = divmod(inches, 12)
+        table[f'{feet}-{rest}'] = inches
+        for foot in feet_marks:
+            for inch in inch_marks:
+                for space in ['', ' ']:
+                    table[f'{feet}{foot}{space}{rest}{inch}'] = inches
+    return table
+
+BATS_THROWS = {f'{b}{sep}{t}' for b in 'LRSB' for t in 'LRSB' for sep in '/-'}
+
+# column -> rule. `values` is a lookup table (typed as Int64) or a set of allowed strings.
+# A bad required field rejects the row; a bad optional field is nulled and the row kept.
+PLAYER_SCHEMA = {
+    'College': {'required': True},
+    'Name': {'required': True},
+    'Jersey': {'values': int_values(0, 99)},
+    'Position': {},
+    'Class Year': {},
+    'Height': {'values': height_values(60, 90)},
+    'Weight': {'values': int_values(100, 400)},
+    'B/T': {'values': BATS_THROWS | {v.lower() for v in BATS_THROWS}},
+    'High School': {},
+    'Hometown': {},
+    'Season': {'required': True, 'values': int_values(1990, 2100)},
+}
+
+COACH_SCHEMA = {
+    'College': {'required': True},
+    'Name': {'required': True},
+    'Title': {'required': True},
+    'Season': {'required': True, 'values': int_values(1990, 2100)},
+}
+
+def read_raw(path):
+    # Everything as text; validate_records decides what is missing and how to type it
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+def validate_records(raw_df, schema):
+    """
+    Check required fields, formats and ranges column by column.
+    Returns (clean typed frame, quarantine frame of offending raw rows with reasons).
+    """
+    clean_df = raw_df.copy()
+    rejected = np.zeros(len(raw_df), dtype=bool)
+    issues = []
+
+    for col, rule in schema.items():
+        if col not in raw_df.columns:
+            if rule.get('required'):
+                raise ValueError(f'Missing required column: {col}')
+            continue
+
+        raw = raw_df[col]
+        values = rule.get('values')
+        if isinstance(values, dict):
+            typed = raw.map(values).astype('Int64')
+            bad = typed.isna().to_numpy()
+        elif values is not None:
+            typed = raw
+            bad = ~raw.isin(values).to_numpy()
+        else:
+            typed = raw
+            bad = raw.isin(MISSING_VALUES).to_numpy()
+        # Only rows that failed the lookup can be missing rather than invalid
+        missing = np.zeros(len(raw), dtype=bool)
+        missing[bad] = raw[bad].isin(MISSING_VALUES).to_numpy()
+        invalid = bad & ~missing
+
+        clean_df[col] = typed.where(~bad)
+        issues.append((f'{col} invalid', invalid))
+        if rule.get('required'):
+            issues.append((f'{col} missing', missing))
+            rejected |= bad
+
+    offending = np.logical_or.reduce([mask for _, mask in issues]) if issues else rejected
+    reasons = np.full(offending.sum(), '', dtype=object)
+    for label, mask in issues:
+        mask = mask[offending]
+        reasons = np.where(mask & (reasons != ''), reasons + '; ', reasons)
+        reasons = np.where(mask, reasons + label, reasons)
+
+    quarantine_df = raw_df[offending].assign(Reasons=reasons, Rejected=rejected[offending])
+    return clean_df[~rejected].reset_index(drop=True), quarantine_df
+
+def write_quarantine(quarantine_dir, **frames):
+    os.makedirs(quarantine_dir, exist_ok=True)
+    for name, df in frames.items():
+        df.to_csv(os.path.join(quarantine_dir, f'{name}.csv'), index=False)
+        print(f"{name}: {len(df)} rows quarantined ({int(df['Rejected'].sum())} rejected).")
+
 def dedup_high_schools(players_df, highschools_df):
     canonical_hs = highschools_df['name'].unique()
 
@@ -32,13 +141,17 @@ def dedup_high_schools(players_df, highschools_df):
 
     return players_df, highschools_df
 
+TITLE_SEPARATOR = ' | '
+
 def dedup_coaches(coaches_df):
     # 1. John Smith at ABC Univ: Head Coach
     # 2. John Smith at ABC Univ: Recruiting Coordinator
     # => 1. John Smith at ABC Univ: Head Coach | Recruiting Coordinator
-    coaches_clean = coaches_df.groupby(['Name', 'College', 'Season'], as_index=False).agg({
-        'Title': lambda x: ' | '.join(sorted(set(x)))
-    })
+    keys = ['Name', 'College', 'Season']
+    titles = coaches_df.drop_duplicates(subset=keys + ['Title']).sort_values(keys + ['Title'])
+    # Concatenate unique sorted titles with a grouped string sum instead of a per-group lambda
+    coaches_clean = titles.assign(Title=titles['Title'] + TITLE_SEPARATOR).groupby(keys, as_index=False)['Title'].sum()
+    coaches_clean['Title'] = coaches_clean['Title'].str[:-len(TITLE_SEPARATOR)]
     return coaches_clean
 
 def extract_positions(pos_str, mapping):
@@ -101,30 +214,30 @@ def standardize_class_year(players_df):
     
     return players_df
 
-def map_team(players_df, coaches_df):
-    teams_mapping = {
-        'University of Florida': 'Florida Gators',
-        'University of Missouri': 'Missouri Tigers',
-        'University of Oklahoma': 'Oklahoma Sooners',
-        'University of Alabama': 'Alabama Crimson Tide',
-        'University of Washington': 'Washington Huskies',
-        'University of Oregon': 'Oregon Ducks',
-        'University of Indiana': 'Indiana Hoosiers',
-        'University of Minnesota': 'Minnesota Golden Gophers',
-        'Texas A&M University': 'Texas A&M Aggies',
-        'University of Southern Mississippi': 'Southern Miss Golden Eagles',
-        'Troy University': 'Troy Trojans',
-        'University of Louisiana at Lafayette': 'Louisiana Ragin\' Cajuns',
-        'Rice University': 'Rice Owls',
-        'University of Memphis': 'Memphis Tigers',
-        'University of North Carolina at Charlotte': 'Charlotte 49ers',
-        'Oregon State University': 'Oregon State Beavers',
-        'Texas Tech University': 'Texas Tech Red Raiders',
-        'Oklahoma State University': 'Oklahoma State Cowboys',
-        'Fresno State University': 'Fresno State Bulldogs',
-        'Air Force Academy': 'Air Force Falcons',
-    }
-
+TEAMS_MAPPING = {
+    'University of Florida': 'Florida Gators',
+    'University of Missouri': 'Missouri Tigers',
+    'University of Oklahoma': 'Oklahoma Sooners',
+    'University of Alabama': 'Alabama Crimson Tide',
+    'University of Washington': 'Washington Huskies',
+    'University of Oregon': 'Oregon Ducks',
+    'University of Indiana': 'Indiana Hoosiers',
+    'University of Minnesota': 'Minnesota Golden Gophers',
+    'Texas A&M University': 'Texas A&M Aggies',
+    'University of Southern Mississippi': 'Southern Miss Golden Eagles',
+    'Troy University': 'Troy Trojans',
+    'University of Louisiana at Lafayette': 'Louisiana Ragin\' Cajuns',
+    'Rice University': 'Rice Owls',
+    'University of Memphis': 'Memphis Tigers',
+    'University of North Carolina at Charlotte': 'Charlotte 49ers',
+    'Oregon State University': 'Oregon State Beavers',
+    'Texas Tech University': 'Texas Tech Red Raiders',
+    'Oklahoma State University': 'Oklahoma State Cowboys',
+    'Fresno State University': 'Fresno State Bulldogs',
+    'Air Force Academy': 'Air Force Falcons',
+}
+
+def map_team(players_df, coaches_df, teams_mapping=TEAMS_MAPPING):
     players_df['Team'] = players_df['College'].apply(lambda x: teams_mapping.get(x))
     coaches_df['Team'] = coaches_df['College'].apply(lambda x: teams_mapping.get(x))
 
@@ -264,6 +377,11 @@ def extract_roles(title):
 
     return roles
 
+def extract_roles_column(titles):
+    # Titles repeat across seasons and staffs; parse each distinct title once
+    unique_titles = titles.drop_duplicates()
+    return titles.map(pd.Series([extract_roles(t) for t in unique_titles], index=unique_titles.values))
+
 def standardize_hometown(players_df):
     # Mapping for US States and Canadian Provinces commonly found in baseball rosters
     state_map = {
@@ -359,20 +477,268 @@ def standardize_hometown(players_df):
     players_df['Hometown'] = players_df['Hometown'].apply(clean_hometown)
     return players_df
 
+PLAYER_REGISTRY_COLUMNS = ['Player ID', 'Name Key', 'State', 'High School', 'Hometown', 'Season', 'College']
+HOMETOWN_MATCH_CUTOFF = 85
+
+def player_name_key(names):
+    # Case, punctuation and spacing differences don't make a different player
+    return names.str.lower().str.replace(r"[^a-z ]", '', regex=True).str.split().str.join(' ')
+
+def home_state(hometowns):
+    return hometowns.str.rsplit(',', n=1).str[1].str.strip().str.rstrip('.').str.upper()
+
+def home_city(hometowns):
+    return hometowns.str.rsplit(',', n=1).str[0].str.strip().str.lower()
+
+def same_home(row, candidate):
+    # Name plus home state is the block, and the hometown has to agree too when both sides have one.
+    # Without a state to block on, only the same high school links two rows.
+    if pd.isna(row['State']) or pd.isna(candidate['State']):
+        return pd.notna(row['High School']) and row['High School'] == candidate['High School']
+    if row['State'] != candidate['State']:
+        return False
+    if pd.isna(row['City']) or pd.isna(candidate['City']):
+        return True
+    return fuzz.ratio(row['City'], candidate['City']) >= HOMETOWN_MATCH_CUTOFF
+
+def player_match_score(row, candidate):
+    # Inside the block a matching high school breaks ties first, then hometown similarity
+    same_school = pd.notna(row['High School']) and row['High School'] == candidate['High School']
+    city_score = fuzz.ratio(row['City'], candidate['City']) if pd.notna(row['City']) and pd.notna(candidate['City']) else 0
+    return same_school, city_score
+
+def load_player_registry(registry_path):
+    if not os.path.exists(registry_path):
+        return pd.DataFrame({
+            c: pd.Series(dtype='Int64' if c in ('Player ID', 'Season') else object) for c in PLAYER_REGISTRY_COLUMNS
+        })
+    return pd.read_csv(registry_path, dtype={'Player ID': 'Int64', 'Season': 'Int64'})
+
+def resolve_player_ids(players_df, registry_df):
+    """
+    Assign a stable integer Player ID across seasons and teams.
+    Every roster appearance (name, hometown, high school, season, college) is kept in
+    the registry, so a repeat appearance resolves by exact lookup. A new one joins the
+    best existing player with the same name and home (see same_home), skipping any
+    player already on a different college that season; otherwise it is a new player.
+    """
+    unit_cols = ['Name', 'Hometown', 'High School', 'Season', 'College']
+    lookup_cols = ['Name Key', 'Hometown', 'High School', 'Season', 'College']
+    observed = players_df.sort_values(['Season', 'Name', 'Hometown', 'High School', 'College'])[unit_cols].drop_duplicates()
+    observed = observed.assign(**{
+        'Name Key': player_name_key(observed['Name']),
+        'State': home_state(observed['Hometown']),
+        'City': home_city(observed['Hometown']),
+    })
+    observed = observed.merge(
+        registry_df[lookup_cols + ['Player ID']].drop_duplicates(subset=lookup_cols), on=lookup_cols, how='left',
+    )
+
+    # Known players by name key (one candidate per distinct home/high school) and the colleges each played for per season
+    by_name = {}
+    seasons = {}
+    def remember(unit):
+        candidates = by_name.setdefault(unit['Name Key'], {})
+        candidates.setdefault((unit['Player ID'], unit['Hometown'], unit['High School']), unit)
+        seasons.setdefault(unit['Player ID'], {}).setdefault(unit['Season'], set()).add(unit['College'])
+
+    for unit in registry_df.assign(City=home_city(registry_df['Hometown'])).to_dict('records'):
+        remember(unit)
+    for unit in observed[observed['Player ID'].notna()].to_dict('records'):
+        remember(unit)
+    next_id = int(registry_df['Player ID'].max()) + 1 if len(registry_df) else 1
+
+    new_units = {}
+    for i, row in observed[observed['Player ID'].isna()].to_dict('index').items():
+        candidates = [
+            c for c in by_name.get(row['Name Key'], {}).values()
+            if same_home(row, c) and not seasons[c['Player ID']].get(row['Season'], set()) - {row['College']}
+        ]
+        if candidates:
+            player_id = max(candidates, key=lambda c: player_match_score(row, c))['Player ID']
+        else:
+            player_id = next_id
+            next_id += 1
+
+        unit = {**row, 'Player ID': player_id}
+        remember(unit)
+        new_units[i] = unit
+
+    if new_units:
+        observed.loc[list(new_units), 'Player ID'] = [u['Player ID'] for u in new_units.values()]
+    players_df = players_df.merge(observed[unit_cols + ['Player ID']], on=unit_cols, how='left')
+    players_df.insert(0, 'Player ID', players_df.pop('Player ID').astype('Int64'))
+
+    new_rows = pd.DataFrame([{c: u[c] for c in PLAYER_REGISTRY_COLUMNS} for u in new_units.values()], columns=PLAYER_REGISTRY_COLUMNS)
+    registry_df = pd.concat([registry_df, new_rows], ignore_index=True)
+    registry_df[['Player ID', 'Season']] = registry_df[['Player ID', 'Season']].astype('Int64')
+
+    print(f"Players: {players_df['Player ID'].nunique()} resolved, {len(new_units)} new roster appearances.")
+    return players_df, registry_df
+
+PLAYER_KEY = ['Player ID']
+
+def team_conferences(teams_df, conferences_df):
+    # Team name -> conference name (teams.csv only stores the abbreviation)
+    conf_names = conferences_df.set_index('abbreviation')['name']
+    return pd.Series(teams_df['member of'].map(conf_names).values, index=teams_df['team'])
+
+def aggregate_high_school_players(players_df):
+    return (
+        players_df.dropna(subset=['High School'])
+        .drop_duplicates(subset=['Season', 'High School'] + PLAYER_KEY)
+        .groupby(['Season', 'High School'], as_index=False)
+        .size()
+        .rename(columns={'size': 'Players'})
+        .sort_values(['Season', 'Players', 'High School'], ascending=[True, False, True])
+    )
+
+def aggregate_handedness_by_conference(players_df, teams_df, conferences_df):
+    pos_cols = [c for c in players_df.columns if c.startswith('position') and c[len('position'):].isdigit()]
+    df = players_df.assign(Conference=players_df['Team'].map(team_conferences(teams_df, conferences_df)))
+    df = df.dropna(subset=['Conference'])
+
+    positions = df[pos_cols]
+    df = df.assign(**{
+        'Left-Handed Batters': df['Batting'].eq('Left'),
+        'Right-Handed Batters': df['Batting'].eq('Right'),
+        'Switch Hitters': df['Batting'].eq('Switch'),
+        'Left-Handed Throwers': df['Throwing'].eq('Left'),
+        'Right-Handed Throwers': df['Throwing'].eq('Right'),
+        'Left-Handed Pitchers': positions.eq('Left-Handed Pitcher').any(axis=1)
+            | (positions.eq('Pitcher').any(axis=1) & df['Throwing'].eq('Left')),
+    })
+    flags = [
+        'Left-Handed Batters', 'Right-Handed Batters', 'Switch Hitters',
+        'Left-Handed Throwers', 'Right-Handed Throwers', 'Left-Handed Pitchers',
+    ]
+
+    # A player listed twice on one conference's rosters in a season counts once
+    per_player = df.groupby(['Season', 'Conference'] + PLAYER_KEY, as_index=False)[flags].any()
+    summary = per_player.groupby(['Season', 'Conference'])[flags].sum().astype(int)
+    summary.insert(0, 'Players', per_player.groupby(['Season', 'Conference']).size())
+    return summary.reset_index().sort_values(['Season', 'Conference'])
+
+def aggregate_shared_high_schools(players_df):
+    team_hs = players_df.dropna(subset=['High School', 'Team'])[['Season', 'Team', 'High School']].drop_duplicates()
+    pairs = team_hs.merge(team_hs, on=['Season', 'High School'], suffixes=(' 1', ' 2'))
+    pairs = pairs[pairs['Team 1'] < pairs['Team 2']]
+    return (
+        pairs.groupby(['Season', 'Team 1', 'Team 2'], as_index=False)['High School']
+        .nunique()
+        .rename(columns={'High School': 'Shared High Schools'})
+        .sort_values(['Season', 'Shared High Schools', 'Team 1', 'Team 2'], ascending=[True, False, True, True])
+    )
+
+def aggregate_transfers(players_df):
+    # Same rule as the loader: a different team in the next season
+    stints = players_df.dropna(subset=['Team'])[PLAYER_KEY + ['Season', 'Team']].drop_duplicates()
+    next_season = stints.assign(Season=stints['Season'] - 1)
+    moves = stints.merge(next_season, on=PLAYER_KEY + ['Season'], suffixes=(' From', ' To'))
+    moves = moves[moves['Team From'] != moves['Team To']]
+    return (
+        moves.assign(Season=moves['Season'] + 1)
+        .rename(columns={'Team From': 'From Team', 'Team To': 'To Team'})
+        .groupby(['Season', 'From Team', 'To Team'], as_index=False)
+        .size()
+        .rename(columns={'size': 'Transfers'})
+        .sort_values(['Season', 'Transfers', 'From Team', 'To Team'], ascending=[True, False, True, True])
+    )
+
+def aggregate_coach_careers(coaches_df):
+    # One row per stint: consecutive seasons with the same team. Previous Team marks a move between programs.
+    df = coaches_df.dropna(subset=['Team'])[['Name', 'Team', 'Season', 'Role List']]
+    df = df.sort_values(['Name', 'Team', 'Season'])
+    prev = df.shift()
+    new_stint = df['Name'].ne(prev['Name']) | df['Team'].ne(prev['Team']) | df['Season'].gt(prev['Season'] + 1)
+    df = df.assign(Stint=new_stint.cumsum())
+
+    careers = df.groupby('Stint').agg(
+        Name=('Name', 'first'),
+        Team=('Team', 'first'),
+        **{'First Season': ('Season', 'min'), 'Last Season': ('Season', 'max'), 'Seasons': ('Season', 'nunique')},
+    )
+
+    roles = df[['Stint', 'Role List']].explode('Role List').dropna().drop_duplicates().sort_values(['Stint', 'Role List'])
+    careers['Roles'] = (
+        (roles['Role List'] + TITLE_SEPARATOR).groupby(roles['Stint']).sum().str[:-len(TITLE_SEPARATOR)]
+    )
+
+    careers = careers.sort_values(['Name', 'First Season', 'Team']).reset_index(drop=True)
+
+    # Previous Team: the latest earlier stint under the same name that ended before this one began.
+    # Overlapping stints (one name on two staffs at once, usually two coaches) are never a move,
+    # and when two teams tie for the latest earlier stint it is unknown which one the coach left.
+    earlier = careers[['Name', 'Team', 'Last Season']].rename(columns={'Team': 'Previous Team', 'Last Season': 'Previous Last'})
+    pairs = careers[['Name', 'First Season']].reset_index().merge(earlier, on='Name')
+    pairs = pairs[pairs['Previous Last'] < pairs['First Season']]
+    pairs = pairs[pairs['Previous Last'].eq(pairs.groupby('index')['Previous Last'].transform('max'))]
+    latest = pairs.drop_duplicates('index', keep=False)
+    careers['Previous Team'] = latest.set_index('index')['Previous Team']
+    return careers
+
+def compute_aggregates(players_df, teams_df, conferences_df):
+    # Per-season rollups for the README analyses, loaded as summary nodes
+    return {
+        'high_school_stats': aggregate_high_school_players(players_df),
+        'conference_stats': aggregate_handedness_by_conference(players_df, teams_df, conferences_df),
+        'shared_high_school_stats': aggregate_shared_high_schools(players_df),
+        'transfer_stats': aggregate_transfers(players_df),
+    }
+
+def run_pipeline(raw_dir='data/raw', processed_dir='data/processed', teams_mapping=TEAMS_MAPPING, stage=None,
+                 quarantine_dir=None, registry_path=None):
+    # `stage(name)` returns a context manager wrapped around each step (used by benchmark.py)
+    stage = stage or (lambda name: contextlib.nullcontext())
+    quarantine_dir = quarantine_dir or os.path.join(os.path.dirname(raw_dir), 'quarantine')
+    # Player ID assignments persist between runs next to the raw data
+    registry_path = registry_path or os.path.join(os.path.dirname(raw_dir), 'player_ids.csv')
+
+    with stage('read_raw'):
+        players_df = read_raw(os.path.join(raw_dir, 'players.csv'))
+        highschools_df = pd.read_csv(os.path.join(raw_dir, 'highschools.csv'))
+        coaches_df = read_raw(os.path.join(raw_dir, 'coaches.csv'))
+
+    with stage('validate'):
+        players_df, players_quarantine = validate_records(players_df, PLAYER_SCHEMA)
+        coaches_df, coaches_quarantine = validate_records(coaches_df, COACH_SCHEMA)
+        write_quarantine(quarantine_dir, players=players_quarantine, coaches=coaches_quarantine)
+
+    with stage('dedup_high_schools'):
+        players_df, highschools_df = dedup_high_schools(players_df, highschools_df)
+    with stage('standardize_player_positions'):
+        players_df = standardize_player_positions(players_df)
+    with stage('standardize_batting_throwing'):
+        players_df = standardize_batting_throwing(players_df)
+    with stage('standardize_class_year'):
+        players_df = standardize_class_year(players_df)
+    with stage('standardize_hometown'):
+        players_df = standardize_hometown(players_df)
+    with stage('resolve_player_ids'):
+        players_df, registry_df = resolve_player_ids(players_df, load_player_registry(registry_path))
+    with stage('dedup_coaches'):
+        coaches_df = dedup_coaches(coaches_df)
+    with stage('map_team'):
+        players_df, coaches_df = map_team(players_df, coaches_df, teams_mapping)
+    with stage('extract_roles'):
+        coaches_df['Role List'] = extract_roles_column(coaches_df['Title'])
+    with stage('aggregate_coach_careers'):
+        coach_careers_df = aggregate_coach_careers(coaches_df)
+
+    with stage('compute_aggregates'):
+        teams_df = pd.read_csv(os.path.join(processed_dir, 'teams.csv'), encoding='utf-8-sig')
+        conferences_df = pd.read_csv(os.path.join(processed_dir, 'conferences.csv'), encoding='utf-8-sig')
+        aggregates = compute_aggregates(players_df, teams_df, conferences_df)
+
+    with stage('write_processed'):
+        players_df.to_csv(os.path.join(processed_dir, 'players.csv'), index=False)
+        highschools_df.to_csv(os.path.join(processed_dir, 'highschools.csv'), index=False)
+        coaches_df.to_csv(os.path.join(processed_dir, 'coaches.csv'), index=False)
+        coach_careers_df.to_csv(os.path.join(processed_dir, 'coach_careers.csv'), index=False)
+        registry_df.to_csv(registry_path, index=False)
+
+        for name, df in aggregates.items():
+            df.to_csv(os.path.join(processed_dir, f'{name}.csv'), index=False)
+
 if __name__ == '__main__':
-    players_df = pd.read_csv('data/raw/players.csv')
-    highschools_df = pd.read_csv('data/raw/highschools.csv')
-    coaches_df = pd.read_csv('data/raw/coaches.csv')
-
-    players_df, highschools_df = dedup_high_schools(players_df, highschools_df)
-    players_df = standardize_player_positions(players_df)
-    players_df = standardize_batting_throwing(players_df)
-    players_df = standardize_class_year(players_df)
-    players_df = standardize_hometown(players_df)
-    coaches_df = dedup_coaches(coaches_df)
-    players_df, coaches_df = map_team(players_df, coaches_df)
-    coaches_df['Role List'] = coaches_df['Title'].apply(extract_roles)
-
-    players_df.to_csv('data/processed/players.csv', index=False)
-    highschools_df.to_csv('data/processed/highschools.csv', index=False)
-    coaches_df.to_csv('data/processed/coaches.csv', index=False)
\ No newline at end of file
+    run_pipeline()
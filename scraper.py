@@ -1,7 +1,6 @@
 from bs4 import BeautifulSoup
 import requests
 import csv
-import pandas as pd
 
 def scrape_school(school_name, url, season):
     players, coaches = [], []
@@ -85,9 +84,8 @@ def parse_sidearm(school_name, soup, season):
                     sr_only = height_elem.find('span', class_='sr-only')
                     if sr_only:
                         sr_only.decompose()
+                    # Kept as printed (6'2"); process_data validates and converts to inches
                     height = height_elem.text.strip()
-                    feet, inch = height.split("'")[0], height.split("'")[1].replace('"', '')
-                    height = 12 * int(feet) + int(inch)
                 else:
                     height = 'N/A'
                 
@@ -192,8 +190,6 @@ def parse_sidearm_classic(school_name, soup, season):
             # Height / Weight
             height_tag = item.find("span", class_="sidearm-roster-player-height")
             height = height_tag.get_text(strip=True) if height_tag else "N/A"
-            feet, inch = height.split("'")[0], height.split("'")[1].replace('"', '')
-            height = 12 * int(feet) + int(inch)
 
             weight_tag = item.find("span", class_="sidearm-roster-player-weight")
             weight = weight_tag.get_text(strip=True) if weight_tag else "N/A"
@@ -313,7 +309,7 @@ SCHOOLS_2024 = {
     'Air Force Academy': 'https://goairforcefalcons.com/sports/baseball/roster/2024',
 }
 
-if __name__ == '__main__':
+def scrape_all():
     all_players_data = []
     all_coaches_data = []
     high_schools = set()
@@ -363,4 +359,7 @@ if __name__ == '__main__':
         writer.writerow(['name'])
 
         for univ, _ in SCHOOLS.items():
-            writer.writerow([univ])
\ No newline at end of file
+            writer.writerow([univ])
+
+if __name__ == '__main__':
+    scrape_all()
@@ -0,0 +1,239 @@
+import argparse
+import csv
+import os
+import random
+import shutil
+
+from process_data import TEAMS_MAPPING
+
+FIRST_NAMES = [
+    'Aiden', 'Blake', 'Brady', 'Caden', 'Carson', 'Cole', 'Connor', 'Dylan', 'Eli', 'Ethan',
+    'Gavin', 'Grant', 'Hunter', 'Jack', 'Jace', 'Jake', 'Jordan', 'Kyle', 'Landon', 'Logan',
+    'Luke', 'Mason', 'Matt', 'Nate', 'Noah', 'Owen', 'Parker', 'Reid', 'Ryan', 'Tanner',
+    'Trey', 'Ty', 'Wyatt', 'Zach', 'Carlos', 'Diego', 'Mateo', 'Andrés', 'Kai', 'Malik',
+]
+LAST_NAMES = [
+    'Anderson', 'Baker', 'Brooks', 'Carter', 'Collins', 'Davis', 'Edwards', 'Evans', 'Fisher', 'Garcia',
+    'Gonzalez', 'Gray', 'Hall', 'Harris', 'Hughes', 'Jackson', 'Johnson', 'Kelly', 'Lee', 'Lopez',
+    'Martin', 'Miller', 'Mitchell', 'Moore', 'Nelson', 'Parker', 'Perez', 'Reed', 'Rivera', 'Roberts',
+    'Sanders', 'Smith', 'Stewart', 'Taylor', 'Thompson', 'Turner', 'Walker', 'Ward', 'White', "O'Brien",
+]
+CITIES = [
+    'Jacksonville', 'Tampa', 'Houston', 'Dallas', 'Austin', 'Atlanta', 'Nashville', 'Memphis', 'Mobile',
+    'Tulsa', 'Norman', 'Portland', 'Eugene', 'Seattle', 'Spokane', 'Fresno', 'San Diego', 'Sacramento',
+    'Minneapolis', 'St. Paul', 'Indianapolis', 'Chicago', 'Charlotte', 'Raleigh', 'Lafayette', 'Baton Rouge',
+    'Phoenix', 'Denver', 'Kansas City', 'St. Louis', 'Little Rock', 'Birmingham', 'Columbia', 'Omaha',
+]
+# Several spellings per state, as they appear on real rosters
+STATE_VARIANTS = {
+    'FL': ['Fla.', 'Florida', 'FL', 'Fla'],
+    'TX': ['Texas', 'Tex.', 'TX'],
+    'GA': ['Ga.', 'Georgia', 'GA'],
+    'TN': ['Tenn.', 'Tennessee', 'TN'],
+    'AL': ['Ala.', 'Alabama', 'AL'],
+    'OK': ['Okla.', 'Oklahoma', 'OK'],
+    'OR': ['Ore.', 'Oregon', 'OR'],
+    'WA': ['Wash.', 'Washington', 'WA'],
+    'CA': ['Calif.', 'California', 'CA', 'Cal.'],
+    'MN': ['Minn.', 'Minnesota', 'MN'],
+    'IN': ['Ind.', 'Indiana', 'IN'],
+    'IL': ['Ill.', 'Illinois', 'IL'],
+    'NC': ['N.C.', 'North Carolina', 'NC'],
+    'LA': ['La.', 'Louisiana', 'LA'],
+    'AZ': ['Ariz.', 'Arizona', 'AZ'],
+    'CO': ['Colo.', 'Colorado', 'CO'],
+    'MO': ['Mo.', 'Missouri', 'MO'],
+    'AR': ['Ark.', 'Arkansas', 'AR'],
+    'SC': ['S.C.', 'South Carolina', 'SC'],
+    'NE': ['Neb.', 'Nebraska', 'NE'],
+    'ON': ['Ontario', 'ON'],
+    'PR': ['Puerto Rico', 'P.R.'],
+}
+HS_PREFIXES = [
+    'Lincoln', 'Jefferson', 'Central', 'West', 'East', 'North', 'South', 'Catholic', 'Christian',
+    'Bishop', 'Saint Thomas', 'Cardinal', 'Lakeside', 'Riverside', 'Oak Ridge', 'Cedar Park', 'Valley',
+    'Mountain View', 'Heritage', 'Liberty', 'Memorial', 'Westlake', 'Hillcrest', 'Forest Hill',
+]
+HS_SUFFIXES = ['', ' HS', ' High School', ' Academy', ' Prep']
+POSITIONS = ['RHP', 'RHP', 'RHP', 'LHP', 'LHP', 'C', 'INF', 'OF', 'INF/OF', 'C/INF', 'UTL', 'UTIL',
+             'Inf.', '1B', 'SS', '2B/SS', '3B', 'CF', 'OF/LHP', 'RHP/INF', 'Infield', 'Outfield', 'P']
+CLASS_YEARS = ['Fr.', 'R-Fr.', 'So.', 'R-So.', 'Jr.', 'R-Jr.', 'Sr.', 'R-Sr.', 'Gr.']
+BATS_THROWS = ['R/R', 'R/R', 'R/R', 'L/L', 'L/R', 'R/L', 'S/R', 'B/R', 'R-R', 'L-L', 'N/A', '1st Year']
+COACH_TITLES = [
+    'Head Coach', 'Associate Head Coach', 'Assistant Coach', 'Assistant Coach / Pitching',
+    'Assistant Coach/Hitting', 'Pitching Coach', 'Assistant Coach / Recruiting Coordinator',
+    'Volunteer Assistant Coach', 'Student Assistant Coach', 'Strength & Conditioning Coach',
+    'Associate Head Coach/Recruiting Coordinator', 'Assistant Coach (Infield)', 'Undergraduate Assistant Coach',
+]
+MASCOTS = ['Hawks', 'Bears', 'Owls', 'Falcons', 'Rams', 'Lions', 'Wolves', 'Tigers', 'Panthers', 'Eagles']
+
+def noisy_high_school(rng, canonical, city):
+    # Same school written differently across rosters
+    variant = rng.random()
+    if variant < 0.55:
+        return canonical
+    base = canonical.replace(' High School', '').replace(' HS', '')
+    if variant < 0.7:
+        return f'{base} ({city})'
+    if variant < 0.8:
+        return base.replace('Saint ', 'St. ')
+    if variant < 0.9:
+        return f'{base} High School' if not canonical.endswith('High School') else f'{base} HS'
+    return base.upper() if rng.random() < 0.3 else base
+
+def make_teams(n_teams):
+    colleges = list(TEAMS_MAPPING.items())[:n_teams]
+    for i in range(len(colleges), n_teams):
+        colleges.append((f'Synthetic State University {i}', f'Synthetic State {i} {MASCOTS[i % len(MASCOTS)]}'))
+    return colleges
+
+def generate_league(n_teams, n_seasons, players_per_team=40, coaches_per_team=8,
+                    first_season=2025, transfer_rate=0.03, seed=0):
+    """
+    Build raw players/coaches/high school rows in the scraper's format for
+    n_teams x n_seasons. Rosters carry over between seasons (class years advance,
+    seniors leave) and a small share of returning players transfer.
+    """
+    rng = random.Random(seed)
+    colleges = make_teams(n_teams)
+    college_names = [c for c, _ in colleges]
+
+    # Roughly one canonical school per two roster spots, so schools repeat across teams
+    n_schools = max(50, n_teams * players_per_team // 2)
+    schools = []
+    for i in range(n_schools):
+        city = rng.choice(CITIES)
+        state = rng.choice(list(STATE_VARIANTS))
+        name = f'{rng.choice(HS_PREFIXES)}{rng.choice(HS_SUFFIXES)}'
+        if i >= len(HS_PREFIXES) * len(HS_SUFFIXES):
+            name = f'{city} {name}'
+        schools.append((name, city, state))
+
+    def new_player():
+        school, city, state = rng.choice(schools)
+        bt = rng.choice(BATS_THROWS)
+        return {
+            'Name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'Position': rng.choice(POSITIONS),
+            'class_index': rng.choice([0, 0, 1, 2, 4]),
+            'Height': rng.randint(66, 79) if rng.random() > 0.02 else 'N/A',
+            'Weight': rng.randint(160, 250) if rng.random() > 0.02 else 'N/A',
+            'B/T': bt,
+            'school': school,
+            'city': city,
+            'state': state,
+        }
+
+    rosters = {college: [new_player() for _ in range(players_per_team)] for college in college_names}
+    staffs = {
+        college: [(f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', rng.choice(COACH_TITLES))
+                  for _ in range(coaches_per_team)]
+        for college in college_names
+    }
+
+    players, coaches = [], []
+    for season_offset in range(n_seasons):
+        season = first_season - n_seasons + 1 + season_offset
+
+        for college in college_names:
+            for jersey, p in enumerate(rosters[college], start=1):
+                players.append({
+                    'College': college,
+                    'Name': p['Name'],
+                    'Jersey': jersey,
+                    'Position': p['Position'],
+                    'Class Year': CLASS_YEARS[min(p['class_index'], len(CLASS_YEARS) - 1)],
+                    'Height': p['Height'],
+                    'Weight': p['Weight'],
+                    'B/T': p['B/T'],
+                    'High School': noisy_high_school(rng, p['school'], p['city']),
+                    'Hometown': f"{p['city']}, {rng.choice(STATE_VARIANTS[p['state']])}",
+                    'Season': season,
+                })
+            for name, title in staffs[college]:
+                coaches.append({'College': college, 'Name': name, 'Title': title, 'Season': season})
+
+        # Next season: advance, graduate, transfer, recruit
+        transfers = []
+        for college in college_names:
+            returning = []
+            for p in rosters[college]:
+                p['class_index'] += 2 if rng.random() < 0.8 else 1
+                if p['class_index'] >= len(CLASS_YEARS):
+                    continue
+                if rng.random() < transfer_rate and n_teams > 1:
+                    transfers.append((college, p))
+                else:
+                    returning.append(p)
+            rosters[college] = returning
+        for college, p in transfers:
+            destination = rng.choice([c for c in college_names if c != college])
+            rosters[destination].append(p)
+        for college in college_names:
+            while len(rosters[college]) < players_per_team:
+                rosters[college].append(new_player())
+
+            # Occasional staff turnover, sometimes to another program
+            staff = staffs[college]
+            if rng.random() < 0.3:
+                i = rng.randrange(len(staff))
+                moved = staff.pop(i)
+                other = rng.choice(college_names)
+                staffs[other].append((moved[0], rng.choice(COACH_TITLES)))
+            while len(staff) < coaches_per_team:
+                staff.append((f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', rng.choice(COACH_TITLES)))
+
+    # Mirrors scraper.py: the high school list is every roster spelling with '/' removed
+    high_schools = sorted({
+        p['High School'].replace('/', '').strip() for p in players if p['High School'] != 'N/A'
+    })
+    return players, coaches, high_schools, colleges
+
+def write_league(out_dir, players, coaches, high_schools, colleges, conferences_src='data/processed'):
+    """
+    Lay out out_dir like data/: raw/ scraper output plus the static reference
+    tables in processed/ that process_data.py and the loader expect.
+    """
+    raw_dir = os.path.join(out_dir, 'raw')
+    processed_dir = os.path.join(out_dir, 'processed')
+    os.makedirs(raw_dir, exist_ok=True)
+    os.makedirs(processed_dir, exist_ok=True)
+
+    def write_rows(path, rows, fieldnames):
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    write_rows(os.path.join(raw_dir, 'players.csv'), players,
+               ['College', 'Name', 'Jersey', 'Position', 'Class Year', 'Height', 'Weight', 'B/T', 'High School', 'Hometown', 'Season'])
+    write_rows(os.path.join(raw_dir, 'coaches.csv'), coaches, ['College', 'Name', 'Title', 'Season'])
+    write_rows(os.path.join(raw_dir, 'highschools.csv'), [{'name': hs} for hs in high_schools], ['name'])
+
+    for name in ['conferences.csv', 'positions.csv']:
+        shutil.copy(os.path.join(conferences_src, name), os.path.join(processed_dir, name))
+    with open(os.path.join(conferences_src, 'conferences.csv'), encoding='utf-8-sig') as file:
+        abbreviations = [row['abbreviation'] for row in csv.DictReader(file)]
+
+    write_rows(os.path.join(processed_dir, 'colleges.csv'), [{'name': c} for c, _ in colleges], ['name'])
+    write_rows(
+        os.path.join(processed_dir, 'teams.csv'),
+        [{'college': c, 'member of': abbreviations[i % len(abbreviations)], 'team': t} for i, (c, t) in enumerate(colleges)],
+        ['college', 'member of', 'team'],
+    )
+    return raw_dir, processed_dir
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic league in the raw scraper format.')
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--seasons', type=int, default=2)
+    parser.add_argument('--players-per-team', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out-dir', default='data/synthetic')
+    args = parser.parse_args()
+
+    players, coaches, high_schools, colleges = generate_league(
+        args.teams, args.seasons, args.players_per_team, seed=args.seed
+    )
+    write_league(args.out_dir, players, coaches, high_schools, colleges)
+    print(f'{len(players)} player rows, {len(coaches)} coach rows and {len(high_schools)} high schools written to {args.out_dir}.')